@@ -0,0 +1,221 @@
+"""Compares a pytest-benchmark run against the baseline stored in `benchmarks/baseline.json`.
+
+The baseline only keeps the median time of each benchmark, so it stays small enough to review in a diff.
+A benchmark regresses when its median is slower than the baseline by more than its tolerance. The default
+tolerance, per-benchmark overrides, and benchmarks to ignore (both `fnmatch` patterns of the benchmark
+names) are stored in the baseline, too, and are kept when it gets updated.
+
+Run with:
+    uv run pytest benchmarks/ --benchmark-only --benchmark-json=.benchmarks/latest.json
+    uv run python benchmarks/compare.py .benchmarks/latest.json
+    uv run python benchmarks/compare.py .benchmarks/latest.json --update
+
+Exits with 1 when any benchmark regressed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import sys
+from dataclasses import dataclass
+from fnmatch import fnmatch
+from pathlib import Path
+
+BASELINE_PATH = Path(__file__).parent / "baseline.json"
+
+DEFAULT_TOLERANCE = 0.25
+
+
+@dataclass
+class Comparison:
+    name: str
+    baseline: float | None
+    current: float | None
+    tolerance: float
+
+    @property
+    def change(self) -> float | None:
+        if not self.baseline or self.current is None:
+            return None
+
+        return (self.current - self.baseline) / self.baseline
+
+    @property
+    def status(self) -> str:
+        if self.baseline is None:
+            return "new"
+
+        if self.current is None:
+            return "missing"
+
+        change = self.change
+
+        if change is None:
+            return "ok"
+
+        if change > self.tolerance:
+            return "REGRESSED"
+
+        if change < -self.tolerance:
+            return "improved"
+
+        return "ok"
+
+
+def load_run(path: Path, baseline: dict) -> dict[str, float]:
+    """Load the median of each benchmark from a `--benchmark-json` file, keyed by the full benchmark name.
+
+    Benchmarks that match an `ignore` pattern of the baseline are skipped.
+    """
+
+    data = json.loads(path.read_text())
+    ignore = baseline.get("ignore", [])
+
+    return {
+        benchmark["fullname"]: benchmark["stats"]["median"]
+        for benchmark in data["benchmarks"]
+        if not any(fnmatch(benchmark["fullname"], pattern) for pattern in ignore)
+    }
+
+
+def load_baseline(path: Path) -> dict:
+    if not path.exists():
+        return {"default_tolerance": DEFAULT_TOLERANCE, "tolerances": {}, "ignore": [], "benchmarks": {}}
+
+    return json.loads(path.read_text())
+
+
+def get_tolerance(baseline: dict, name: str, default: float | None = None) -> float:
+    """Get the tolerance of a benchmark; the first matching pattern in `tolerances` wins."""
+
+    for pattern, tolerance in baseline.get("tolerances", {}).items():
+        if fnmatch(name, pattern):
+            return tolerance
+
+    if default is not None:
+        return default
+
+    return baseline.get("default_tolerance", DEFAULT_TOLERANCE)
+
+
+def compare(baseline: dict, run: dict[str, float], *, default_tolerance: float | None = None) -> list[Comparison]:
+    benchmarks = baseline.get("benchmarks", {})
+    names = list(benchmarks) + [name for name in run if name not in benchmarks]
+
+    return [
+        Comparison(
+            name=name,
+            baseline=benchmarks.get(name),
+            current=run.get(name),
+            tolerance=get_tolerance(baseline, name, default_tolerance),
+        )
+        for name in names
+    ]
+
+
+def _format_time(seconds: float | None) -> str:
+    if seconds is None:
+        return "-"
+
+    if seconds >= 1:
+        return f"{seconds:.3f}s"
+
+    if seconds >= 0.001:  # noqa: PLR2004
+        return f"{seconds * 1000:.3f}ms"
+
+    return f"{seconds * 1_000_000:.3f}us"
+
+
+def format_comparisons(comparisons: list[Comparison], *, show_all: bool = False) -> str:
+    """Format the comparisons as a table; only the changed and new benchmarks unless `show_all`.
+
+    Benchmarks that are missing from the run, e.g. because it was filtered with `-k`, are only counted.
+    """
+
+    rows = [
+        (
+            comparison.name,
+            _format_time(comparison.baseline),
+            _format_time(comparison.current),
+            "-" if comparison.change is None else f"{comparison.change:+.1%}",
+            f"±{comparison.tolerance:.0%}",
+            comparison.status,
+        )
+        for comparison in comparisons
+        if show_all or comparison.status not in {"ok", "missing"}
+    ]
+
+    missing = sum(comparison.status == "missing" for comparison in comparisons)
+    compared = len(comparisons) - missing
+    summary = f"{missing} benchmarks in the baseline were not in the run." if missing else ""
+
+    if not rows:
+        return "\n".join(filter(None, [f"All {compared} benchmarks are within their tolerance.", summary]))
+
+    headers = ("Benchmark", "Baseline", "Current", "Change", "Tolerance", "Status")
+    widths = [max(len(value) for value in column) for column in zip(headers, *rows, strict=False)]
+
+    lines = ["  ".join(value.ljust(width) for value, width in zip(row, widths, strict=True)).rstrip() for row in rows]
+    lines.insert(0, "  ".join(header.ljust(width) for header, width in zip(headers, widths, strict=True)).rstrip())
+    lines.insert(1, "  ".join("-" * width for width in widths))
+
+    regressed = sum(comparison.status == "REGRESSED" for comparison in comparisons)
+    lines.append("")
+    lines.append(f"{regressed} of {compared} benchmarks regressed.")
+
+    if summary:
+        lines.append(summary)
+
+    return "\n".join(lines)
+
+
+def update_baseline(baseline: dict, run: dict[str, float]) -> dict:
+    """Replace the medians in the baseline with the ones from the run, keeping the tolerances.
+
+    Benchmarks that were not in the run keep their baseline, so a run filtered with `-k` only updates those.
+    """
+
+    benchmarks = {**baseline.get("benchmarks", {}), **run}
+
+    return {
+        "machine": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "system": platform.system(),
+            "machine": platform.machine(),
+        },
+        "default_tolerance": baseline.get("default_tolerance", DEFAULT_TOLERANCE),
+        "tolerances": baseline.get("tolerances", {}),
+        "ignore": baseline.get("ignore", []),
+        "benchmarks": {name: float(f"{median:.4g}") for name, median in sorted(benchmarks.items())},
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Compare a pytest-benchmark run against the stored baseline.")
+    parser.add_argument("run", type=Path, help="The JSON file from `pytest --benchmark-json`.")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH, help="The baseline JSON file.")
+    parser.add_argument("--tolerance", type=float, help="Override the default tolerance, e.g. 0.1 for 10%%.")
+    parser.add_argument("--all", action="store_true", help="Show all benchmarks, not only the changed ones.")
+    parser.add_argument("--update", action="store_true", help="Store the run as the new baseline.")
+    args = parser.parse_args(argv)
+
+    baseline = load_baseline(args.baseline)
+    run = load_run(args.run, baseline)
+
+    if args.update:
+        args.baseline.write_text(json.dumps(update_baseline(baseline, run), indent=2) + "\n")
+        print(f"Updated {args.baseline} with {len(run)} benchmarks.")  # noqa: T201
+
+        return 0
+
+    comparisons = compare(baseline, run, default_tolerance=args.tolerance)
+    print(format_comparisons(comparisons, show_all=args.all))  # noqa: T201
+
+    return int(any(comparison.status == "REGRESSED" for comparison in comparisons))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,123 @@
+"""Generates synthetic dj-angles templates for the benchmarks.
+
+The fixtures in `benchmarks/templates/` have a fixed size, so they cannot show how the conversion scales.
+`generate_template` builds a template with as many of each dj-angles construct as needed, so a benchmark
+can grow one dimension at a time and compare the timings.
+
+Example:
+    generate_template(tags=100, depth=5, conditionals=10, expressions=20, slots=5, error_boundaries=2)
+"""
+
+from __future__ import annotations
+
+from dj_angles.replacers.attributes import replace_conditionals, replace_values
+from dj_angles.replacers.comments import mask_comments
+from dj_angles.replacers.tags import replace_tags
+from dj_angles.replacers.variables import replace_variables
+
+# The settings that the generated templates need, e.g. `settings.ANGLES.update(SYNTHETIC_ANGLES_SETTINGS)`
+SYNTHETIC_ANGLES_SETTINGS = {
+    "slots_enabled": True,
+}
+
+# The dimensions that `generate_template` can grow
+DIMENSIONS = ("tags", "depth", "conditionals", "expressions", "slots", "error_boundaries")
+
+# The replacers in the order that `convert_template` runs them
+PHASES = {
+    "mask_comments": mask_comments,
+    "replace_conditionals": replace_conditionals,
+    "replace_variables": replace_variables,
+    "replace_values": replace_values,
+    "replace_tags": replace_tags,
+}
+
+
+def _tag(i: int) -> str:
+    return f'<dj-include src="partials/item-{i}.html" />'
+
+
+def _conditional(i: int) -> str:
+    return (
+        f'<div dj-if="item_{i}.is_active">{{{{ item_{i}.name }}}}</div>\n'
+        f'<div dj-elif="item_{i}.is_pending">Pending</div>\n'
+        f"<div dj-else>Inactive</div>"
+    )
+
+
+def _expression(i: int) -> str:
+    return f"<span>{{{{ item_{i}.title or 'Untitled' }}}}</span>"
+
+
+def _slot(i: int) -> str:
+    return f'<dj-include template="slot.html">\n  <span slot="test1">Card {i}</span>\n</dj-include>'
+
+
+def _error_boundary(i: int) -> str:
+    return (
+        f'<dj-error-boundary default="Error {i}">\n'
+        f'  <dj-include src="partials/widget-{i}.html" />\n'
+        f"</dj-error-boundary>"
+    )
+
+
+def generate_template(
+    *,
+    tags: int = 0,
+    depth: int = 0,
+    conditionals: int = 0,
+    expressions: int = 0,
+    slots: int = 0,
+    error_boundaries: int = 0,
+) -> str:
+    """Generates a synthetic dj-angles template.
+
+    Args:
+        tags: The number of self-closing `dj-include` tags.
+        depth: How many `dj-block` tags are nested around the body.
+        conditionals: The number of `dj-if`/`dj-elif`/`dj-else` chains.
+        expressions: The number of `{{ a or b }}` expressions.
+        slots: The number of `dj-include` tags that fill a slot of `tests/templates/slot.html`.
+        error_boundaries: The number of `dj-error-boundary` tags around an include.
+
+    Returns:
+        The template HTML string.
+    """
+
+    parts = ["{# Synthetic benchmark template #}", "<h1>{{ title }}</h1>"]
+
+    parts.extend(_tag(i) for i in range(tags))
+    parts.extend(_conditional(i) for i in range(conditionals))
+    parts.extend(_expression(i) for i in range(expressions))
+    parts.extend(_slot(i) for i in range(slots))
+    parts.extend(_error_boundary(i) for i in range(error_boundaries))
+
+    body = "\n".join(parts)
+
+    for level in reversed(range(depth)):
+        body = f'<dj-block name="level-{level}">\n{body}\n</dj-block name="level-{level}">'
+
+    return f"<!DOCTYPE html>\n<html>\n<body>\n{body}\n</body>\n</html>\n"
+
+
+def get_phase_inputs(html: str) -> dict[str, str]:
+    """Gets the input that each replacer gets when `convert_template` converts the HTML.
+
+    This allows benchmarking a replacer on its own with the same input that it would see in the pipeline.
+    """
+
+    inputs = {"mask_comments": html}
+
+    (html, _) = mask_comments(html)
+    inputs["replace_conditionals"] = html
+
+    html = replace_conditionals(html)
+    inputs["replace_variables"] = html
+
+    html = replace_variables(html)
+    inputs["replace_values"] = html
+
+    html = replace_values(html)
+    inputs["replace_tags"] = html
+
+    return inputs
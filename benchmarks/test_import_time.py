@@ -0,0 +1,90 @@
+"""Import-time benchmarks for dj-angles via pytest-benchmark and `python -X importtime`.
+
+Short-lived processes, e.g. management commands or serverless cold starts, pay for every module that
+gets imported. Each benchmark imports a dj-angles module in a fresh interpreter with `-X importtime`
+and stores how long the dj-angles modules took to import in `extra_info`:
+
+- `import_us`: the cumulative import time of the module in microseconds, if it was not already imported when Django
+  was set up
+- `dj_angles_us`: the self import time of all `dj_angles` modules in microseconds
+- `slowest`: the dj-angles modules with the highest self import time
+
+The benchmark time itself is the whole subprocess, including starting the interpreter and Django.
+
+Run with:
+    uv run pytest benchmarks/test_import_time.py --benchmark-only -v
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+SRC_DIR = Path(__file__).parent.parent / "src"
+
+MODULES = (
+    "dj_angles",
+    "dj_angles.replacers",
+    "dj_angles.template_loader",
+    "dj_angles.templatetags.dj_angles",
+)
+
+# Modules that should only be imported when the feature that needs them gets used
+LAZY_MODULES = ("minestrone", "dj_angles.mappers.thirdparty")
+
+
+def _import(module: str) -> dict[str, tuple[int, int]]:
+    """Import `module` in a fresh interpreter and return the self and cumulative import time of every module."""
+
+    # Django needs to be set up before the template tags can be imported; `dj_angles` is installed like in a project
+    code = (
+        "import django; from django.conf import settings; settings.configure(INSTALLED_APPS=['dj_angles']); "
+        f"django.setup(); import {module}"
+    )
+
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        check=True,
+        text=True,
+        env={**os.environ, "PYTHONPATH": str(SRC_DIR)},
+    )
+
+    timings = {}
+
+    # Lines look like "import time:       239 |        351 |     dj_angles.settings"
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+
+        (self_us, cumulative_us, name) = line.removeprefix("import time:").split("|")
+        timings[name.strip()] = (int(self_us), int(cumulative_us))
+
+    return timings
+
+
+@pytest.mark.parametrize("module", MODULES)
+def test_bench_import_time(benchmark, module):
+    """Import a dj-angles module in a fresh interpreter."""
+
+    timings = benchmark.pedantic(_import, args=(module,), rounds=5, iterations=1)
+
+    dj_angles_timings = {name: self_us for name, (self_us, _) in timings.items() if name.startswith("dj_angles")}
+    slowest = sorted(dj_angles_timings.items(), key=lambda item: item[1], reverse=True)[:5]
+
+    benchmark.extra_info.update(
+        {
+            "module": module,
+            # `-X importtime` does not report modules imported with `importlib`, e.g. `dj_angles` by `django.setup()`
+            "import_us": timings[module][1] if module in timings else None,
+            "dj_angles_us": sum(dj_angles_timings.values()),
+            "slowest": dict(slowest),
+        }
+    )
+
+    for lazy_module in LAZY_MODULES:
+        assert lazy_module not in timings, f"{module} imports {lazy_module}"
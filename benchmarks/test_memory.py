@@ -0,0 +1,168 @@
+"""Memory benchmarks for dj-angles template conversion and rendering via pytest-benchmark and `tracemalloc`.
+
+Each benchmark times the work like the other benchmarks and also measures it once with `tracemalloc`:
+
+- `peak_bytes`: the most memory that was allocated at any point while doing the work
+- `retained_bytes`: the memory that was still allocated afterwards, i.e. the result and anything cached
+- `retained_blocks`: the number of memory blocks (roughly, objects) that were still allocated afterwards
+
+`tracemalloc` only knows about memory that is currently allocated, so the allocation volume of a
+conversion shows up as `peak_bytes`. The work is done once before measuring so that one-time costs,
+e.g. compiling regexes, are not included. The numbers are stored in `extra_info`, so they are in the
+`--benchmark-json` output next to the timings.
+
+Run with:
+    uv run pytest benchmarks/test_memory.py --benchmark-only -v
+    uv run pytest benchmarks/test_memory.py --benchmark-only --benchmark-json=memory.json
+"""
+
+from __future__ import annotations
+
+import gc
+import tracemalloc
+
+import pytest
+from django.template import Context
+from synthetic import DIMENSIONS, SYNTHETIC_ANGLES_SETTINGS, generate_template, get_phase_inputs
+from test_benchmarks import _RENDER_CONTEXT, COMPLEX_ANGLES_HTML, PLAIN_HTML, SIMPLE_ANGLES_HTML, _make_engine
+
+from dj_angles.attributes import Attributes
+from dj_angles.replacers import convert_template
+from dj_angles.replacers.tags import replace_tags
+
+FIXTURES = {
+    "plain": PLAIN_HTML,
+    "simple_angles": SIMPLE_ANGLES_HTML,
+    "complex_angles": COMPLEX_ANGLES_HTML,
+}
+
+# The sizes of each synthetic dimension
+SIZES = (10, 100, 1000)
+
+# The number of attributes in the `Attributes` benchmarks
+ATTRIBUTE_COUNTS = (1, 10, 100)
+
+
+@pytest.fixture(autouse=True)
+def synthetic_settings(settings):
+    settings.ANGLES.update(SYNTHETIC_ANGLES_SETTINGS)
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _measure_memory(func, *args) -> dict[str, int]:
+    """Measure the memory that `func(*args)` allocates with `tracemalloc`."""
+
+    # Warm up caches and compiled regexes so that only the cost of the work itself is measured
+    func(*args)
+    gc.collect()
+
+    # Ignore the memory used by `tracemalloc` itself for the snapshots
+    filters = [tracemalloc.Filter(inclusive=False, filename_pattern=tracemalloc.__file__)]
+
+    tracemalloc.start()
+
+    try:
+        before = tracemalloc.take_snapshot().filter_traces(filters)
+        (start, _) = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+
+        result = func(*args)
+
+        (_, peak) = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot().filter_traces(filters)
+    finally:
+        tracemalloc.stop()
+
+    stats = after.compare_to(before, "filename")
+    del result
+
+    return {
+        "peak_bytes": peak - start,
+        "retained_bytes": sum(stat.size_diff for stat in stats),
+        "retained_blocks": sum(stat.count_diff for stat in stats),
+    }
+
+
+def _bench_memory(benchmark, func, *args, **extra_info):
+    benchmark.extra_info.update(extra_info)
+    benchmark.extra_info.update(_measure_memory(func, *args))
+
+    return benchmark(func, *args)
+
+
+def _get_attributes(count: int) -> str:
+    return " ".join(f'data-attribute-{i}="value {i}"' if i % 2 else f"flag-{i}" for i in range(count))
+
+
+# ---------------------------------------------------------------------------
+# 1. convert_template
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize("fixture", FIXTURES)
+def test_bench_memory_convert_fixture(benchmark, fixture):
+    """Memory of converting each fixture in `benchmarks/templates/`."""
+
+    html = FIXTURES[fixture]
+
+    result = _bench_memory(benchmark, convert_template, html, fixture=fixture, input_size=len(html))
+    assert "<html" in result
+
+
+@pytest.mark.parametrize("size", SIZES)
+@pytest.mark.parametrize("dimension", DIMENSIONS)
+def test_bench_memory_convert_synthetic(benchmark, dimension, size):
+    """Memory of converting a synthetic template with `size` of one dimension."""
+
+    html = generate_template(**{dimension: size})
+
+    result = _bench_memory(benchmark, convert_template, html, dimension=dimension, size=size, input_size=len(html))
+    assert "<html>" in result
+
+
+# ---------------------------------------------------------------------------
+# 2. replace_tags and Attributes
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize("size", SIZES)
+@pytest.mark.parametrize("dimension", ["tags", "slots", "error_boundaries"])
+def test_bench_memory_replace_tags(benchmark, dimension, size):
+    """Memory of `replace_tags` on its own for the dimensions that add tags."""
+
+    html = get_phase_inputs(generate_template(**{dimension: size}))["replace_tags"]
+
+    result = _bench_memory(benchmark, replace_tags, html, dimension=dimension, size=size, input_size=len(html))
+    assert "<html>" in result
+
+
+@pytest.mark.parametrize("count", ATTRIBUTE_COUNTS)
+def test_bench_memory_attributes(benchmark, count):
+    """Memory of parsing `count` attributes of a tag."""
+
+    template_tag_args = _get_attributes(count)
+
+    result = _bench_memory(benchmark, Attributes, template_tag_args, count=count, input_size=len(template_tag_args))
+    assert len(result) == count
+
+
+# ---------------------------------------------------------------------------
+# 3. Rendering
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize("fixture", FIXTURES)
+def test_bench_memory_render_fixture(benchmark, fixture):
+    """Memory of rendering each fixture from the warm cached loader."""
+
+    template = _make_engine(cached=True).get_template(f"{fixture}.html")
+
+    def render():
+        return template.render(Context(_RENDER_CONTEXT))
+
+    result = _bench_memory(benchmark, render, fixture=fixture)
+    assert result
@@ -0,0 +1,182 @@
+"""Render-time benchmarks for the dj-angles template tags via pytest-benchmark.
+
+Renders the `call`, `model`, `view`, and `template` template tags inside loops of 10, 100, and 1,000
+iterations next to the closest plain Django construct, so the per-call overhead of each template tag is
+visible. Each pair of benchmarks shares a group and `extra_info` has the mean time per loop iteration.
+
+- `call`: `{% call add(i, 1) as result %}` vs. the `add` filter
+- `model`: `{% model Book.objects.count() as count %}` vs. `{{ books.count }}` with the manager in the context
+- `view`: `{% view 'item' i %}` vs. `{% include %}` of a template
+- `template`: `{% call item(i) %}` of an inline `{% template %}` vs. `{% include ... with %}`
+
+Run with:
+    uv run pytest benchmarks/test_render.py --benchmark-only -v
+    uv run pytest benchmarks/test_render.py --benchmark-only --benchmark-group-by=group
+"""
+
+from __future__ import annotations
+
+import pytest
+from django.http import HttpResponse
+from django.template import Context, Template
+from django.urls import path
+from example.book.models import Book
+
+LOOPS = (10, 100, 1000)
+
+# The URLconf for the `view` benchmarks
+pytestmark = pytest.mark.urls(__name__)
+
+
+def item_view(request, number):  # noqa: ARG001
+    return HttpResponse(f"<li>{number}</li>")
+
+
+urlpatterns = [
+    path("item/<int:number>/", item_view, name="item"),
+]
+
+ITEM_TEMPLATE = Template("<li>{{ number }}</li>")
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _loop(body: str) -> Template:
+    return Template(f"{{% for i in items %}}{body}{{% endfor %}}")
+
+
+def _bench_render(benchmark, template: Template, context: dict, *, tag: str, loops: int) -> str:
+    """Benchmark rendering `template` with a `loops` long `items` list in the context."""
+
+    benchmark.group = f"render-{tag}-{loops}"
+    benchmark.extra_info["loops"] = loops
+
+    context = {**context, "items": list(range(loops))}
+
+    def render():
+        return template.render(Context(context))
+
+    result = benchmark(render)
+
+    if benchmark.stats:
+        benchmark.extra_info["mean_per_loop"] = benchmark.stats.stats.mean / loops
+
+    return result
+
+
+@pytest.fixture
+def books(db):  # noqa: ARG001
+    Book.objects.bulk_create([Book(title=f"Book {i}") for i in range(10)])
+
+    return Book.objects
+
+
+# ---------------------------------------------------------------------------
+# 1. call
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize("loops", LOOPS)
+def test_bench_render_call(benchmark, loops):
+    """`call` a function in the context for every iteration."""
+
+    template = _loop("{% call add(i, 1) as result %}{{ result }}")
+    context = {"add": lambda a, b: a + b}
+
+    result = _bench_render(benchmark, template, context, tag="call", loops=loops)
+    assert result.startswith("12")
+
+
+@pytest.mark.parametrize("loops", LOOPS)
+def test_bench_render_call_plain(benchmark, loops):
+    """Plain Django: the `add` filter for every iteration."""
+
+    template = _loop("{{ i|add:1 }}")
+
+    result = _bench_render(benchmark, template, {}, tag="call", loops=loops)
+    assert result.startswith("12")
+
+
+# ---------------------------------------------------------------------------
+# 2. model
+#
+# Both variants run a `COUNT` query per iteration, so the difference is the
+# overhead of looking up the model and evaluating the call.
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize("loops", LOOPS)
+def test_bench_render_model(benchmark, books, loops):  # noqa: ARG001
+    """`model` query for every iteration."""
+
+    template = _loop("{% model Book.objects.count() as count %}{{ count }}")
+
+    result = _bench_render(benchmark, template, {}, tag="model", loops=loops)
+    assert result.startswith("1010")
+
+
+@pytest.mark.parametrize("loops", LOOPS)
+def test_bench_render_model_plain(benchmark, books, loops):
+    """Plain Django: the manager in the context and `{{ books.count }}` for every iteration."""
+
+    template = _loop("{{ books.count }}")
+
+    result = _bench_render(benchmark, template, {"books": books}, tag="model", loops=loops)
+    assert result.startswith("1010")
+
+
+# ---------------------------------------------------------------------------
+# 3. view
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize("loops", LOOPS)
+def test_bench_render_view(benchmark, rf, loops):
+    """`view` by URL name with an argument for every iteration."""
+
+    template = _loop("{% view 'item' i %}")
+
+    result = _bench_render(benchmark, template, {"request": rf.get("/")}, tag="view", loops=loops)
+    assert result.startswith("<li>0</li><li>1</li>")
+
+
+@pytest.mark.parametrize("loops", LOOPS)
+def test_bench_render_view_plain(benchmark, rf, loops):
+    """Plain Django: `include` a template for every iteration."""
+
+    template = _loop("{% include item_template with number=i %}")
+    context = {"request": rf.get("/"), "item_template": ITEM_TEMPLATE}
+
+    result = _bench_render(benchmark, template, context, tag="view", loops=loops)
+    assert result.startswith("<li>0</li><li>1</li>")
+
+
+# ---------------------------------------------------------------------------
+# 4. template
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize("loops", LOOPS)
+def test_bench_render_template(benchmark, loops):
+    """`call` an inline `template` for every iteration."""
+
+    template = Template(
+        "{% template item(number) %}<li>{{ number }}</li>{% endtemplate %}"
+        "{% for i in items %}{% call item(i) %}{% endfor %}"
+    )
+
+    result = _bench_render(benchmark, template, {}, tag="template", loops=loops)
+    assert result.startswith("<li>0</li><li>1</li>")
+
+
+@pytest.mark.parametrize("loops", LOOPS)
+def test_bench_render_template_plain(benchmark, loops):
+    """Plain Django: `include ... with` a template for every iteration."""
+
+    template = _loop("{% include item_template with number=i %}")
+
+    result = _bench_render(benchmark, template, {"item_template": ITEM_TEMPLATE}, tag="template", loops=loops)
+    assert result.startswith("<li>0</li><li>1</li>")
@@ -0,0 +1,165 @@
+"""Scaling benchmarks for dj-angles template conversion via pytest-benchmark.
+
+Uses the synthetic templates from `synthetic.py` to grow one dimension at a time (tags, nesting depth,
+conditionals, `or` expressions, slots, and error boundaries) and check that the cost of `convert_template`,
+and of each replacer on its own, grows linearly with it.
+
+Run with:
+    uv run pytest benchmarks/test_synthetic.py --benchmark-only -v
+    uv run pytest benchmarks/test_synthetic.py --benchmark-only -k scaling
+"""
+
+from __future__ import annotations
+
+import math
+from time import perf_counter
+
+import pytest
+from synthetic import DIMENSIONS, PHASES, SYNTHETIC_ANGLES_SETTINGS, generate_template, get_phase_inputs
+
+from dj_angles.replacers import convert_template
+
+# The sizes that the conversion benchmarks sweep
+SIZES = (10, 100, 1000)
+
+# The sizes that the scaling checks time; doubling each step keeps the fit stable
+SCALING_SIZES = (50, 100, 200, 400)
+
+# The highest growth exponent that is still considered linear; quadratic growth would be 2
+SUPER_LINEAR_EXPONENT = 1.5
+
+# How long each timing has to take at least to not be dominated by timer noise
+MIN_TIMING_SECONDS = 0.02
+
+
+@pytest.fixture(autouse=True)
+def synthetic_settings(settings):
+    settings.ANGLES.update(SYNTHETIC_ANGLES_SETTINGS)
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _time(func, html: str) -> float:
+    """Return the best time in seconds of one call of `func(html)` across five repeats."""
+
+    number = 1
+
+    while True:
+        start = perf_counter()
+
+        for _ in range(number):
+            func(html)
+
+        elapsed = perf_counter() - start
+
+        if elapsed >= MIN_TIMING_SECONDS:
+            break
+
+        number *= 2
+
+    timings = [elapsed / number]
+
+    for _ in range(4):
+        start = perf_counter()
+
+        for _ in range(number):
+            func(html)
+
+        timings.append((perf_counter() - start) / number)
+
+    return min(timings)
+
+
+def _get_exponent(sizes: tuple[int, ...], timings: list[float]) -> float:
+    """Return the slope of the least-squares fit of log(timing) against log(size).
+
+    A slope of 1 means the timing grows linearly with the size, 2 means quadratically.
+    """
+
+    xs = [math.log(size) for size in sizes]
+    ys = [math.log(timing) for timing in timings]
+    x_mean = sum(xs) / len(xs)
+    y_mean = sum(ys) / len(ys)
+
+    numerator = sum((x - x_mean) * (y - y_mean) for x, y in zip(xs, ys, strict=True))
+    denominator = sum((x - x_mean) ** 2 for x in xs)
+
+    return numerator / denominator
+
+
+def _get_func(target: str):
+    if target == "convert_template":
+        return convert_template
+
+    return PHASES[target]
+
+
+def _get_input(target: str, html: str) -> str:
+    if target == "convert_template":
+        return html
+
+    return get_phase_inputs(html)[target]
+
+
+# ---------------------------------------------------------------------------
+# 1. Conversion benchmarks for each dimension and size
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize("size", SIZES)
+@pytest.mark.parametrize("dimension", DIMENSIONS)
+def test_bench_convert_synthetic(benchmark, dimension, size):
+    """Convert a synthetic template with `size` of one dimension."""
+
+    html = generate_template(**{dimension: size})
+    benchmark.extra_info.update({"dimension": dimension, "size": size, "input_size": len(html)})
+
+    result = benchmark(convert_template, html)
+    assert "<html>" in result
+
+
+# ---------------------------------------------------------------------------
+# 2. Scaling checks
+#
+# Time `convert_template` and each replacer across `SCALING_SIZES` of one
+# dimension and fit the growth exponent. The benchmark fails when it is above
+# `SUPER_LINEAR_EXPONENT`, e.g. when a replacer rescans the whole template for
+# every match. The timings and exponent are stored in `extra_info`.
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize("target", ["convert_template", *PHASES])
+@pytest.mark.parametrize("dimension", DIMENSIONS)
+def test_bench_scaling(benchmark, dimension, target):
+    """Check that `target` grows linearly with `dimension`."""
+
+    func = _get_func(target)
+    inputs = [_get_input(target, generate_template(**{dimension: size})) for size in SCALING_SIZES]
+
+    def sweep():
+        return [_time(func, html) for html in inputs]
+
+    timings = benchmark.pedantic(sweep, rounds=1, iterations=1)
+    exponent = _get_exponent(SCALING_SIZES, timings)
+
+    benchmark.extra_info.update(
+        {
+            "dimension": dimension,
+            "target": target,
+            "sizes": list(SCALING_SIZES),
+            "timings": timings,
+            "exponent": exponent,
+        }
+    )
+
+    timings_display = ", ".join(
+        f"{size}={timing * 1000:.3f}ms" for size, timing in zip(SCALING_SIZES, timings, strict=True)
+    )
+
+    assert exponent <= SUPER_LINEAR_EXPONENT, (
+        f"{target} grows super-linearly with {dimension}: exponent {exponent:.2f} > {SUPER_LINEAR_EXPONENT} "
+        f"({timings_display})"
+    )
@@ -2,7 +2,7 @@ import pytest
 from django.conf import settings
 
 from dj_angles.mappers.mapper import clear_tag_map
-from dj_angles.templatetags.model import clear_models
+from dj_angles.model_registry import clear_models
 
 
 def pytest_configure():
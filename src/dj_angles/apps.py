@@ -0,0 +1,14 @@
+from django.apps import AppConfig
+from django.db.models.signals import class_prepared
+
+
+class Config(AppConfig):
+    name = "dj_angles"
+
+    def ready(self):
+        from dj_angles.model_registry import load_models, register_model  # noqa: PLC0415
+
+        load_models()
+
+        # Keep the models up-to-date with models that get created after the app registry is ready
+        class_prepared.connect(register_model, dispatch_uid="dj_angles.register_model")
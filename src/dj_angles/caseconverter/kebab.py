@@ -1,6 +1,12 @@
+import re
+from functools import lru_cache
+
 from dj_angles.caseconverter.boundaries import OnDelimeterLowercaseNext, OnUpperPrecededByLowerAppendLower
 from dj_angles.caseconverter.caseconverter import CaseConverter
 
+KEBAB_CASE_RE = re.compile(r"^[a-z0-9]+(-[a-z0-9]+)*$")
+"""Matches strings that are already kebab case, i.e. that `kebabify` would not change."""
+
 
 class Kebab(CaseConverter):
     JOIN_CHAR = "-"
@@ -27,4 +33,15 @@ def kebabify(s, **kwargs):
         Hello World => hello-world
 
     """
+    # Strings that are already kebab case do not change unless the delimiters are different
+    if "delimiters" not in kwargs and KEBAB_CASE_RE.match(s):
+        return s
+
+    return _kebabify(s, **kwargs)
+
+
+@lru_cache(maxsize=1024)
+def _kebabify(s, **kwargs):
+    """Cached conversion because the same strings, e.g. tag names, get converted over and over again."""
+
     return Kebab(s, **kwargs).convert()
@@ -0,0 +1,153 @@
+import json
+import os
+
+from django.core.management.base import BaseCommand, CommandError
+from django.template import Origin, engines
+from django.template.backends.django import DjangoTemplates
+
+from dj_angles.profiling import TemplateProfile, profile_template
+from dj_angles.template_loader import Loader
+
+SORT_KEYS = {
+    "mean": lambda profile: profile.mean,
+    "p95": lambda profile: profile.p95,
+    "size": lambda profile: profile.input_size,
+    "tags": lambda profile: profile.tag_count,
+    "comments": lambda profile: profile.comment_count,
+    "memory": lambda profile: profile.peak_memory,
+}
+
+
+def get_loaders(loaders):
+    """Yields the `dj-angles` loaders, including the ones wrapped by another loader, e.g. the cached loader."""
+
+    for loader in loaders:
+        if isinstance(loader, Loader):
+            yield loader
+
+        yield from get_loaders(getattr(loader, "loaders", []))
+
+
+def get_templates():
+    """Yields a tuple of the loader, template name, and path for every template the `dj-angles` loaders can find.
+
+    Templates that are shadowed by a template with the same name in an earlier directory are skipped, like
+    Django does when it loads them.
+    """
+
+    template_names = set()
+    has_loader = False
+
+    for engine in engines.all():
+        if not isinstance(engine, DjangoTemplates):
+            continue
+
+        for loader in get_loaders(engine.engine.template_loaders):
+            has_loader = True
+
+            for template_dir in loader.get_dirs():
+                for root, _, file_names in os.walk(template_dir):
+                    for file_name in sorted(file_names):
+                        path = os.path.join(root, file_name)
+                        template_name = os.path.relpath(path, template_dir).replace(os.sep, "/")
+
+                        if template_name in template_names:
+                            continue
+
+                        template_names.add(template_name)
+
+                        yield (loader, template_name, path)
+
+    if not has_loader:
+        raise CommandError("dj_angles.template_loader.Loader is not in the template loaders")
+
+
+class Command(BaseCommand):
+    help = "Converts every template that dj-angles can load and reports how much each conversion costs."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--iterations",
+            type=int,
+            default=10,
+            help="How many times to convert each template. Defaults to 10.",
+        )
+        parser.add_argument(
+            "--sort",
+            choices=list(SORT_KEYS),
+            default="mean",
+            help="The column to sort the templates by, slowest or largest first. Defaults to mean.",
+        )
+        parser.add_argument(
+            "--limit",
+            type=int,
+            default=None,
+            help="Only report this many templates.",
+        )
+        parser.add_argument(
+            "--json",
+            action="store_true",
+            help="Output JSON instead of a table.",
+        )
+
+    def handle(self, *args, **options):  # noqa: ARG002
+        iterations = options["iterations"]
+
+        if iterations < 1:
+            raise CommandError("--iterations must be at least 1")
+
+        profiles = []
+
+        for loader, template_name, path in get_templates():
+            try:
+                with open(path, encoding=loader.engine.file_charset) as f:
+                    template_string = f.read()
+            except (OSError, UnicodeDecodeError) as e:
+                self.stderr.write(f"Skipping {template_name}: {e}")
+                continue
+
+            origin = Origin(name=path, template_name=template_name, loader=loader)
+
+            try:
+                profile = profile_template(template_string, origin=origin, iterations=iterations)
+            except Exception as e:
+                self.stderr.write(f"Skipping {template_name}: {e}")
+                continue
+
+            profiles.append(profile)
+
+        profiles.sort(key=SORT_KEYS[options["sort"]], reverse=True)
+
+        if options["limit"] is not None:
+            profiles = profiles[: options["limit"]]
+
+        if options["json"]:
+            self.stdout.write(json.dumps([profile.to_dict() for profile in profiles], indent=2))
+        else:
+            self.write_table(profiles)
+
+    def write_table(self, profiles: list[TemplateProfile]) -> None:
+        headers = ("Template", "Mean (ms)", "P95 (ms)", "Size", "Tags", "Comments", "Peak (KiB)")
+        rows = [
+            (
+                profile.template_name,
+                f"{profile.mean * 1000:.3f}",
+                f"{profile.p95 * 1000:.3f}",
+                str(profile.input_size),
+                str(profile.tag_count),
+                str(profile.comment_count),
+                f"{profile.peak_memory / 1024:.1f}",
+            )
+            for profile in profiles
+        ]
+
+        widths = [max(len(value) for value in column) for column in zip(headers, *rows, strict=False)]
+
+        for row in (headers, *rows):
+            # Left-align the template name and right-align the numbers
+            values = [row[0].ljust(widths[0])] + [
+                value.rjust(width) for value, width in zip(row[1:], widths[1:], strict=True)
+            ]
+            self.stdout.write("  ".join(values).rstrip())
+
+        self.stdout.write(f"\n{len(profiles)} templates")
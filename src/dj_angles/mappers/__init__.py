@@ -1,7 +1,9 @@
 from dj_angles.mappers.angles import default_mapper, map_angles_include, map_call, map_model
 from dj_angles.mappers.django import map_autoescape, map_block, map_css, map_endblock, map_extends, map_image
 from dj_angles.mappers.include import map_include
-from dj_angles.mappers.thirdparty import map_bird, map_partial
+
+# Third-party mappers are only imported when they get used, i.e. when the third-party library is installed
+THIRDPARTY_MAPPERS = ("map_bird", "map_partial")
 
 __all__ = [
     "default_mapper",
@@ -18,3 +20,12 @@ __all__ = [
     "map_model",
     "map_partial",
 ]
+
+
+def __getattr__(name: str):
+    if name in THIRDPARTY_MAPPERS:
+        from dj_angles.mappers import thirdparty  # noqa: PLC0415
+
+        return getattr(thirdparty, name)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,7 +1,5 @@
 from typing import TYPE_CHECKING
 
-from minestrone import HTML
-
 from dj_angles.mappers.include import get_include_template_file, map_include
 from dj_angles.strings import dequotify
 from dj_angles.templates import get_template
@@ -47,6 +45,9 @@ def map_angles_include(tag: "Tag") -> str:
     if template is None:
         return f"<{wrapping_tag_name}>"
 
+    # Only import `minestrone` when slots get used because parsing HTML is otherwise not needed
+    from minestrone import HTML  # noqa: PLC0415
+
     rendered_template = str(template.render({}))
     html = HTML(rendered_template)
 
@@ -78,15 +79,24 @@ def map_call(tag: "Tag", template_tag_name: str = "call") -> str:
         return ""
 
     code = dequotify(tag.pop_attribute_value_or_first_key("code"))
-    context_template_variable_attr = tag.attributes.get("as")
+    context_template_variable = None
 
-    if context_template_variable_attr is not None:
-        if hasattr(context_template_variable_attr, "value") and context_template_variable_attr.value:
+    if (context_template_variable_attr := tag.attributes.get("as")) is not None:
+        tag.attributes.remove("as")
+
+        if context_template_variable_attr.value:
             context_template_variable = dequotify(context_template_variable_attr.value)
 
-            return f"{{% {template_tag_name} {code} as {context_template_variable} %}}"
+    django_template_tag = f"{{% {template_tag_name} {code}"
+
+    # Any other attributes are options for the template tag, e.g. `cache`
+    if tag.attributes:
+        django_template_tag = f"{django_template_tag} {tag.attributes}"
 
-    return f"{{% {template_tag_name} {code} %}}"
+    if context_template_variable:
+        django_template_tag = f"{django_template_tag} as {context_template_variable}"
+
+    return f"{django_template_tag} %}}"
 
 
 def map_model(tag: "Tag") -> str:
@@ -157,12 +167,21 @@ def map_view(tag: "Tag", template_tag_name: str = "view") -> str:
         return ""
 
     name = dequotify(tag.pop_attribute_value_or_first_key("name"))
-    context_template_variable_attr = tag.attributes.get("as")
+    context_template_variable = None
+
+    if (context_template_variable_attr := tag.attributes.get("as")) is not None:
+        tag.attributes.remove("as")
 
-    if context_template_variable_attr is not None:
-        if hasattr(context_template_variable_attr, "value") and context_template_variable_attr.value:
+        if context_template_variable_attr.value:
             context_template_variable = dequotify(context_template_variable_attr.value)
 
-            return f"{{% {template_tag_name} {name} as {context_template_variable} %}}"
+    django_template_tag = f"{{% {template_tag_name} {name}"
+
+    # Any other attributes are arguments for the view or options, e.g. `cache=60`
+    if tag.attributes:
+        django_template_tag = f"{django_template_tag} {tag.attributes}"
+
+    if context_template_variable:
+        django_template_tag = f"{django_template_tag} as {context_template_variable}"
 
-    return f"{{% {template_tag_name} {name} %}}"
+    return f"{django_template_tag} %}}"
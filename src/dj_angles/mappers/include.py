@@ -1,12 +1,104 @@
+import hashlib
+import re
 from typing import TYPE_CHECKING, Any, cast
 
+from django.template import Context
+from django.template.base import Lexer, TokenType
+
 from dj_angles.exceptions import InvalidAttributeError, MissingAttributeError
+from dj_angles.settings import get_setting
 from dj_angles.strings import dequotify
 from dj_angles.templates import get_template
 
 if TYPE_CHECKING:
     from dj_angles.tags import Tag
 
+INLINE_ATTRIBUTE_KEY = "inline"
+
+# The variable of the `with` that scopes an inlined template
+INLINE_SCOPE_VARIABLE = "__dj_angles_inline"
+
+# Blocks, extends, and relative includes behave differently when the template is spliced into another template
+NOT_INLINABLE_RE = re.compile(r"{%\s*(?:extends|block)\b|{%\s*include\s+['\"]\.")
+
+"""
+Global storage of the rendered content of static templates (or `None` if the template is not static), keyed by the hash
+of the template source.
+"""
+static_contents: dict[str, str | None] = {}
+
+
+def clear_static_contents() -> None:
+    static_contents.clear()
+
+
+def get_static_content(tag: "Tag", template: Any) -> str | None:
+    """Gets the rendered content of an include template that does not have any variables or template tags, so it can
+    replace the `include` when the template is converted. Only used when the `includes.prerender_static` setting is
+    enabled and the tag has no other attributes.
+
+    Args:
+        param tag: The tag that is being mapped.
+        param template: The template for the include.
+
+    Returns:
+        The rendered template or `None` if the template should be included like normal.
+    """
+
+    if tag.attributes or not get_setting(key_path="includes", setting_name="prerender_static", default=False):
+        return None
+
+    source = template.template.source
+    source_hash = hashlib.sha256(source.encode()).hexdigest()
+
+    if source_hash not in static_contents:
+        content = None
+
+        # Comments are fine because they do not render anything
+        if all(token.token_type in (TokenType.TEXT, TokenType.COMMENT) for token in Lexer(source).tokenize()):
+            content = template.template.render(Context())
+
+        static_contents[source_hash] = content
+
+    return static_contents[source_hash]
+
+
+def get_inline_source(tag: "Tag", template: Any, *, is_inline: bool) -> str | None:
+    """Gets the source of the template to splice into the parent template instead of an `include`, wrapped in a
+    `with` so it gets its own context like an `include`.
+
+    Templates are inlined if the tag has the `inline` attribute or if they are smaller than the
+    `includes.inline_max_size` setting and the tag has no other attributes.
+
+    Args:
+        param tag: The tag that is being mapped.
+        param template: The template for the include.
+        param is_inline: Whether the tag has the `inline` attribute.
+
+    Returns:
+        The wrapped template source or `None` if the template should be included like normal.
+    """
+
+    if tag.attributes:
+        if is_inline:
+            raise InvalidAttributeError(name=tag.tag_name, message="`inline` cannot be used with other attributes")
+
+        return None
+
+    source = template.template.source
+
+    if not is_inline:
+        inline_max_size = get_setting(key_path="includes", setting_name="inline_max_size", default=0)
+
+        if len(source) > inline_max_size:
+            return None
+
+    if NOT_INLINABLE_RE.search(source):
+        return None
+
+    # Scope the template like an `include` so that variables it sets, e.g. with `{% call ... as %}`, do not leak
+    return f"{{% with {INLINE_SCOPE_VARIABLE}=True %}}{source}{{% endwith %}}"
+
 
 def get_include_template_file(tag: "Tag") -> str:
     """Get the template file based for include-like tags.
@@ -62,6 +154,11 @@ def map_include(tag: "Tag") -> str:
     if not tag.attributes and not tag.is_end:
         raise AssertionError("{% include %} must have an template name")
 
+    is_inline = tag.attributes.has(INLINE_ATTRIBUTE_KEY)
+
+    if is_inline:
+        tag.attributes.remove(INLINE_ATTRIBUTE_KEY)
+
     template_file = get_include_template_file(tag)
 
     wrapping_tag_name = tag.get_wrapping_tag_name(name=template_file)
@@ -77,8 +174,12 @@ def map_include(tag: "Tag") -> str:
         extension_idx = template_file.index(".")
         template_file = template_file[0:colon_idx] + template_file[extension_idx:]
 
+    inline_source = None
+
     if template := get_template(template_file, raise_exception=False):
         template_file = f"'{cast(Any, template).template.name}'"
+    elif is_inline:
+        raise InvalidAttributeError(name=tag.tag_name, message=f"`inline` template could not be found: {template_file}")
 
     replacement = ""
 
@@ -92,10 +193,18 @@ def map_include(tag: "Tag") -> str:
         wrapper_classes = f" class={wrapper_classes}"
 
     # Remove the `no-wrap` attribute if it's there
-    if not tag.is_wrapped:
+    if not tag.is_wrapped and tag.attributes.has("no-wrap"):
         tag.attributes.remove("no-wrap")
 
-    if tag.attributes:
+    if template:
+        inline_source = get_inline_source(tag, template, is_inline=is_inline)
+
+        if inline_source is None:
+            inline_source = get_static_content(tag, template)
+
+    if inline_source is not None:
+        replacement = inline_source
+    elif tag.attributes:
         replacement = f"{{% include {template_file} {tag.attributes} %}}"
     else:
         replacement = f"{{% include {template_file} %}}"
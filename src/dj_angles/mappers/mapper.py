@@ -3,6 +3,8 @@ from collections.abc import Callable
 from typing import Optional
 
 import django
+from django.core.signals import setting_changed
+from django.dispatch import receiver
 from django.utils.module_loading import import_string
 
 from dj_angles.mappers.angles import map_call, map_form, map_model, map_view
@@ -43,11 +45,23 @@ tag_map: Optional["TagMap"] = None
 
 
 class TagMap(UserDict):
+    """The mappings of tag names to Django template tags or mapper functions.
+
+    Mappers that are import strings get imported the first time they are looked up instead of when the map
+    gets created, so unused mappers never get imported.
+    """
+
     def __init__(self) -> None:
         super().__init__()
 
         self.data: dict[str | None, Callable | str] = TAG_NAME_TO_DJANGO_TEMPLATE_TAG_MAP.copy()
 
+        self.imported_keys: set[str | None] = set()
+        """The keys with values that have already been tried to be imported."""
+
+        self.mapped_tag_names: dict[str, bool] = {}
+        """Whether a tag name has a mapping regardless of its case, cached by the tag name."""
+
         # Add bird if `django-bird` is installed
         self.add_module_mapper("django_bird", "bird", "dj_angles.mappers.thirdparty.map_bird")
 
@@ -72,8 +86,31 @@ class TagMap(UserDict):
         # Add default mapper if it is defined in the settings
         self.add_default_mapper()
 
-        # Convert string values to imports if possible
-        self.import_strings()
+    def __getitem__(self, key) -> Callable | str:
+        if key not in self.imported_keys:
+            self.import_string(key)
+
+        return self.data[key]
+
+    def __setitem__(self, key, value) -> None:
+        self.data[key] = value
+        self.imported_keys.discard(key)
+
+    def get(self, key, default=None):
+        if key in self.data:
+            return self[key]
+
+        return default
+
+    def is_mapped(self, tag_name: str) -> bool:
+        """Whether the lower-cased tag name has a mapping. Cached because it gets checked for every tag."""
+
+        is_mapped = self.mapped_tag_names.get(tag_name)
+
+        if is_mapped is None:
+            is_mapped = self.mapped_tag_names[tag_name] = tag_name.lower() in self.data
+
+        return is_mapped
 
     def add_custom_mappers(self) -> None:
         """Get custom mappers from settings and add it to the tag map."""
@@ -97,12 +134,23 @@ class TagMap(UserDict):
     def import_strings(self):
         """Try importing any values that are strings."""
 
-        for key, value in self.data.items():
-            if isinstance(value, str):
-                try:
-                    self.data[key] = import_string(value)
-                except ImportError:
-                    pass
+        for key in self.data:
+            self.import_string(key)
+
+    def import_string(self, key: str | None) -> None:
+        """Try importing the value of a key if it is a string, e.g. `"dj_angles.mappers.map_partial"`.
+
+        Values that cannot be imported are template tag names, e.g. `"verbatim"`, and stay strings.
+        """
+
+        value = self.data[key]
+        self.imported_keys.add(key)
+
+        if isinstance(value, str):
+            try:
+                self.data[key] = import_string(value)
+            except ImportError:
+                pass
 
     def add_module_mapper(self, module: str, tag_name: str, mapper: str | Callable) -> None:
         """Add module mappers depending on whether the module is installed or not."""
@@ -127,3 +175,11 @@ def clear_tag_map() -> None:
 
     global tag_map  # noqa: PLW0603
     tag_map = None
+
+
+@receiver(setting_changed)
+def reset_tag_map(*, setting: str, **kwargs) -> None:  # noqa: ARG001
+    """Re-generate the tag map when the `ANGLES` setting gets changed, e.g. with `override_settings`."""
+
+    if setting == "ANGLES":
+        clear_tag_map()
@@ -1,33 +1,107 @@
-class RequestMethodMiddleware:
-    """Adds the request method as boolean properties to the request object."""
+import logging
+from abc import ABC, abstractmethod
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+
+from dj_angles.settings import get_setting
+from dj_angles.timings import Timings, collect_timings
+
+logger = logging.getLogger(__name__)
+
+REQUEST_METHODS = ("POST", "GET", "PATCH", "HEAD", "PUT", "DELETE", "CONNECT", "TRACE")
+
+NO_REQUEST_METHOD_FLAGS = {f"is_{method.lower()}": False for method in REQUEST_METHODS}
+"""All request method flags set to `False`; used for unknown request methods."""
+
+REQUEST_METHOD_FLAGS = {method: {**NO_REQUEST_METHOD_FLAGS, f"is_{method.lower()}": True} for method in REQUEST_METHODS}
+"""The request method flags for each request method, built once so they can be added to a request in one update."""
+
+
+class BaseMiddleware:
+    """Middleware that supports both sync and async requests, so no thread is needed under ASGI."""
+
+    sync_capable = True
+    async_capable = True
 
     def __init__(self, get_response):
         self.get_response = get_response
+        self.async_mode = iscoroutinefunction(self.get_response)
+
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+
+class RequestMiddleware(BaseMiddleware, ABC):
+    """Middleware that updates the request with `process_request` before the view gets called."""
+
+    @abstractmethod
+    def process_request(self, request) -> None: ...
 
     def __call__(self, request):
-        request.is_post = request.method == "POST"
-        request.is_get = request.method == "GET"
-        request.is_patch = request.method == "PATCH"
-        request.is_head = request.method == "HEAD"
-        request.is_put = request.method == "PUT"
-        request.is_delete = request.method == "DELETE"
-        request.is_connect = request.method == "CONNECT"
-        request.is_trace = request.method == "TRACE"
+        if self.async_mode:
+            return self.__acall__(request)
+
+        self.process_request(request)
 
         response = self.get_response(request)
 
         return response
 
+    async def __acall__(self, request):
+        self.process_request(request)
+
+        response = await self.get_response(request)
+
+        return response
+
 
-class RequestAJAXMiddleware:
+class RequestMethodMiddleware(RequestMiddleware):
+    """Adds the request method as boolean properties to the request object."""
+
+    def process_request(self, request) -> None:
+        request.__dict__.update(REQUEST_METHOD_FLAGS.get(request.method, NO_REQUEST_METHOD_FLAGS))
+
+
+class RequestAJAXMiddleware(RequestMiddleware):
     """Adds whether the request is AJAX as a boolean property to the request object."""
 
-    def __init__(self, get_response):
-        self.get_response = get_response
+    def process_request(self, request) -> None:
+        request.is_ajax = request.META.get("HTTP_X_REQUESTED_WITH") == "XMLHttpRequest"
+
+
+class ServerTimingMiddleware(BaseMiddleware):
+    """Adds how long `dj-angles` spent converting templates and rendering the `call`, `model`, and `view` template
+    tags to the `Server-Timing` header of the response. Optionally logs anything that is slower than the
+    `server_timing.slow_threshold` setting.
+    """
 
     def __call__(self, request):
-        request.is_ajax = request.META.get("HTTP_X_REQUESTED_WITH") == "XMLHttpRequest"
+        if self.async_mode:
+            return self.__acall__(request)
 
-        response = self.get_response(request)
+        with collect_timings() as timings:
+            response = self.get_response(request)
+
+        return self.process_response(request, response, timings)
+
+    async def __acall__(self, request):
+        with collect_timings() as timings:
+            response = await self.get_response(request)
+
+        return self.process_response(request, response, timings)
+
+    def process_response(self, request, response, timings: Timings):
+        if server_timing := timings.get_server_timing():
+            if existing_server_timing := response.get("Server-Timing"):
+                server_timing = f"{existing_server_timing}, {server_timing}"
+
+            response["Server-Timing"] = server_timing
+
+        slow_threshold = get_setting(key_path="server_timing", setting_name="slow_threshold", default=None)
+
+        if slow_threshold is not None:
+            for name, label, duration in timings.events:
+                if duration * 1000 >= slow_threshold:
+                    logger.warning("Slow %s for %s: %.2fms (%s)", name, label, duration * 1000, request.path)
 
         return response
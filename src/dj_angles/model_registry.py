@@ -0,0 +1,74 @@
+import logging
+
+from django.apps import apps
+
+logger = logging.getLogger(__name__)
+
+"""
+Global storage of all available models.
+"""
+models = None
+
+
+def add_model(models: dict, app_label: str, model) -> None:
+    """Adds the model to the models dictionary by its name and nested under its app label."""
+
+    model_name = model.__name__
+
+    if model_name in models:
+        if isinstance(models[model_name], dict):
+            logger.warning("Model name collision with app label: %s", model_name)
+        else:
+            logger.warning("Model name collision: %s. Using %s.", model_name, app_label)
+
+    models[model_name] = model
+    models.setdefault(app_label, {})[model_name] = model
+
+
+def get_models() -> dict:
+    models = {}
+
+    for app_config in apps.get_app_configs():
+        app_label = app_config.label
+
+        if app_label not in models:
+            models[app_label] = {}
+
+        for model in app_config.get_models():
+            add_model(models, app_label, model)
+
+    return models
+
+
+def load_models() -> dict:
+    """Builds the global storage of all available models."""
+
+    global models  # noqa: PLW0603
+    models = get_models()
+
+    return models
+
+
+def get_model_registry() -> dict:
+    """Gets the global storage of all available models. They are usually loaded when the app is ready, but get
+    loaded here if `dj_angles` is not in `INSTALLED_APPS`.
+    """
+
+    if models is None:
+        return load_models()
+
+    return models
+
+
+def register_model(sender, **kwargs) -> None:  # noqa: ARG001
+    """Receiver for the `class_prepared` signal to add models that get created after the models were loaded."""
+
+    if models is None or sender._meta.apps is not apps:
+        return
+
+    add_model(models, sender._meta.app_label, sender)
+
+
+def clear_models() -> None:
+    global models  # noqa: PLW0603
+    models = None
@@ -1,7 +1,9 @@
+from functools import cache
 from importlib.util import find_spec
 
 
+@cache
 def is_module_available(module_name):
-    """Helper method to check if a module is available."""
+    """Helper method to check if a module is available. Cached because `find_spec` searches the filesystem."""
 
     return find_spec(module_name) is not None
@@ -0,0 +1,190 @@
+import tracemalloc
+from dataclasses import dataclass, field
+from math import ceil
+from statistics import mean
+from time import perf_counter
+
+from dj_angles.replacers import convert_template
+from dj_angles.signals import phase_converted
+
+
+@dataclass
+class PhaseTotals:
+    """Aggregated stats for a phase of the template conversion."""
+
+    count: int = 0
+    duration: float = 0.0
+    input_size: int = 0
+    edit_count: int = 0
+    match_count: int = 0
+
+    def add(self, other: "PhaseTotals") -> None:
+        self.count += other.count
+        self.duration += other.duration
+        self.input_size += other.input_size
+        self.edit_count += other.edit_count
+        self.match_count += other.match_count
+
+
+class ConversionProfiler:
+    """Collects stats about each phase of the template conversion in memory, keyed by template and phase.
+
+    Can be used as a context manager or by calling `connect` and `disconnect` manually.
+
+    Example:
+        with ConversionProfiler() as profiler:
+            get_template("index.html")
+
+        profiler.get_phase_totals()
+    """
+
+    def __init__(self):
+        self.stats: dict[tuple[str, str], PhaseTotals] = {}
+        """The stats keyed by a tuple of the template name and the phase."""
+
+    def receiver(
+        self,
+        sender,  # noqa: ARG002
+        *,
+        phase: str,
+        origin,
+        duration: float,
+        input_size: int,
+        edit_count: int,
+        match_count: int,
+        **kwargs,  # noqa: ARG002
+    ) -> None:
+        template_name = (origin.template_name or origin.name) if origin else ""
+        key = (str(template_name), phase)
+
+        self.stats.setdefault(key, PhaseTotals()).add(
+            PhaseTotals(
+                count=1,
+                duration=duration,
+                input_size=input_size,
+                edit_count=edit_count,
+                match_count=match_count,
+            )
+        )
+
+    def connect(self) -> None:
+        phase_converted.connect(self.receiver, dispatch_uid=id(self))
+
+    def disconnect(self) -> None:
+        phase_converted.disconnect(dispatch_uid=id(self))
+
+    def clear(self) -> None:
+        self.stats.clear()
+
+    def get_phase_totals(self) -> dict[str, PhaseTotals]:
+        """Gets the stats for each phase across all templates."""
+
+        totals: dict[str, PhaseTotals] = {}
+
+        for (_, phase), stats in self.stats.items():
+            totals.setdefault(phase, PhaseTotals()).add(stats)
+
+        return totals
+
+    def get_template_totals(self) -> dict[str, PhaseTotals]:
+        """Gets the stats for each template across all phases."""
+
+        totals: dict[str, PhaseTotals] = {}
+
+        for (template_name, _), stats in self.stats.items():
+            totals.setdefault(template_name, PhaseTotals()).add(stats)
+
+        return totals
+
+    def __enter__(self) -> "ConversionProfiler":
+        self.connect()
+
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.disconnect()
+
+
+@dataclass
+class TemplateProfile:
+    """The cost of converting a template."""
+
+    template_name: str
+    durations: list[float] = field(default_factory=list)
+    input_size: int = 0
+    tag_count: int = 0
+    comment_count: int = 0
+    peak_memory: int = 0
+
+    @property
+    def mean(self) -> float:
+        return mean(self.durations) if self.durations else 0.0
+
+    @property
+    def p95(self) -> float:
+        return get_percentile(self.durations, 95)
+
+    def to_dict(self) -> dict:
+        return {
+            "template_name": self.template_name,
+            "iterations": len(self.durations),
+            "mean": self.mean,
+            "p95": self.p95,
+            "input_size": self.input_size,
+            "tag_count": self.tag_count,
+            "comment_count": self.comment_count,
+            "peak_memory": self.peak_memory,
+        }
+
+
+def get_percentile(values: list[float], percentile: float) -> float:
+    """Gets the percentile of the values with the nearest-rank method."""
+
+    if not values:
+        return 0.0
+
+    values = sorted(values)
+    index = max(ceil(percentile / 100 * len(values)) - 1, 0)
+
+    return values[index]
+
+
+def profile_template(template_string: str, *, origin=None, iterations: int = 10) -> TemplateProfile:
+    """Converts the template string `iterations` times and measures how long it takes.
+
+    The tag and comment counts and the peak memory are measured in a separate conversion first so that
+    `tracemalloc` and the `phase_converted` receivers do not slow down the timed conversions.
+    """
+
+    template_name = (origin.template_name or origin.name) if origin else ""
+    profile = TemplateProfile(template_name=str(template_name), input_size=len(template_string))
+
+    is_tracing = tracemalloc.is_tracing()
+
+    if not is_tracing:
+        tracemalloc.start()
+
+    tracemalloc.reset_peak()
+    (current, _) = tracemalloc.get_traced_memory()
+
+    try:
+        with ConversionProfiler() as profiler:
+            convert_template(template_string, origin=origin)
+
+        (_, peak) = tracemalloc.get_traced_memory()
+    finally:
+        if not is_tracing:
+            tracemalloc.stop()
+
+    phases = profiler.get_phase_totals()
+
+    profile.tag_count = phases["replace_tags"].match_count
+    profile.comment_count = phases["mask_comments"].match_count
+    profile.peak_memory = peak - current
+
+    for _ in range(iterations):
+        start = perf_counter()
+        convert_template(template_string, origin=origin)
+        profile.durations.append(perf_counter() - start)
+
+    return profile
@@ -1,14 +1,49 @@
 import logging
+from time import perf_counter
 
 from dj_angles.replacers.attributes import replace_conditionals, replace_values
 from dj_angles.replacers.comments import mask_comments
+from dj_angles.replacers.objects import PhaseStats, phase_stats
 from dj_angles.replacers.tags import replace_tags
 from dj_angles.replacers.variables import replace_variables
 from dj_angles.settings import get_setting
+from dj_angles.signals import phase_converted
 
 logger = logging.getLogger(__name__)
 
 
+def run_phase(phase: str, template_origin, func, html: str, **kwargs):  # noqa: ARG001
+    """Runs a phase of the template conversion."""
+
+    return func(html, **kwargs)
+
+
+def profile_phase(phase: str, template_origin, func, html: str, **kwargs):
+    """Runs a phase of the template conversion and sends the `phase_converted` signal with stats about it."""
+
+    stats = PhaseStats()
+    token = phase_stats.set(stats)
+    start = perf_counter()
+
+    try:
+        result = func(html, **kwargs)
+    finally:
+        duration = perf_counter() - start
+        phase_stats.reset(token)
+
+    phase_converted.send(
+        sender=convert_template,
+        phase=phase,
+        origin=template_origin,
+        duration=duration,
+        input_size=len(html),
+        edit_count=stats.edit_count,
+        match_count=stats.match_count,
+    )
+
+    return result
+
+
 def convert_template(html: str, *, origin=None) -> str:
     """Convert a dj-angles template string to Django template syntax.
 
@@ -20,22 +55,25 @@ def convert_template(html: str, *, origin=None) -> str:
         The converted template HTML string.
     """
 
+    # Only profile the phases when something is listening
+    run = profile_phase if phase_converted.has_listeners() else run_phase
+
     # 0. Mask comments
     initial_tag_regex = get_setting("initial_tag_regex", default=r"(dj-)")
 
-    (html, comments) = mask_comments(html, initial_tag_regex=initial_tag_regex)
+    (html, comments) = run("mask_comments", origin, mask_comments, html, initial_tag_regex=initial_tag_regex)
 
     # 1. Replace conditionals, e.g. `<div dj-if="condition">`
-    html = replace_conditionals(html)
+    html = run("replace_conditionals", origin, replace_conditionals, html)
 
     # 2. Replace variables, e.g. `{{ foo or bar }}`
-    html = replace_variables(html)
+    html = run("replace_variables", origin, replace_variables, html)
 
     # 3. Replace value attributes, e.g. `<div dj-value="request.user">`
-    html = replace_values(html)
+    html = run("replace_values", origin, replace_values, html)
 
     # 4. Replace tags, e.g. `<dj-include />`
-    html = replace_tags(html, origin=origin)
+    html = run("replace_tags", origin, replace_tags, html, origin=origin)
 
     # 5. Unmask comments
     for i, comment in enumerate(comments):
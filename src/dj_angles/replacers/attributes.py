@@ -12,7 +12,7 @@ from functools import cache
 from typing import Optional
 
 from dj_angles.htmls import VOID_ELEMENTS
-from dj_angles.replacers.objects import AtomicEdit, apply_edits
+from dj_angles.replacers.objects import AtomicEdit, apply_edits, record_stats
 from dj_angles.settings import get_setting
 
 
@@ -112,6 +112,8 @@ def replace_conditionals(html: str) -> str:
     # Step 1: Find ALL conditional elements
     elements = _find_conditional_elements(html, prefix)
 
+    record_stats(match_count=len(elements))
+
     if not elements:
         return html
 
@@ -405,6 +407,8 @@ def replace_values(html: str) -> str:
         element.value = condition
         elements.append(element)
 
+    record_stats(match_count=len(elements))
+
     # Sort by position so outermost elements are processed first
     elements.sort(key=lambda e: e.tag_start)
 
@@ -1,5 +1,7 @@
 import re
 
+from dj_angles.replacers.objects import record_stats
+
 
 def mask_comments(html: str, initial_tag_regex: str = r"(dj-)") -> tuple[str, list[str]]:
     """Mask Django and custom comments in the HTML string.
@@ -98,4 +100,6 @@ def mask_comments(html: str, initial_tag_regex: str = r"(dj-)") -> tuple[str, li
     # Add remaining text (either everything since last match, or the unclosed block)
     masked_html_parts.append(html[last_pos:])
 
+    record_stats(edit_count=len(comments), match_count=len(comments))
+
     return "".join(masked_html_parts), comments
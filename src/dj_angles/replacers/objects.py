@@ -1,4 +1,5 @@
 import logging
+from contextvars import ContextVar
 from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
@@ -20,9 +21,30 @@ class AtomicEdit:
             return text[: self.position] + self.content + text[self.end_position :]
 
 
+@dataclass
+class PhaseStats:
+    """Counts for a phase of the template conversion. Only collected while the conversion is being profiled."""
+
+    edit_count: int = 0
+    match_count: int = 0
+
+
+phase_stats: ContextVar[PhaseStats | None] = ContextVar("dj_angles_phase_stats", default=None)
+
+
+def record_stats(*, edit_count: int = 0, match_count: int = 0) -> None:
+    """Adds counts to the stats of the current phase if the conversion is being profiled."""
+
+    if (stats := phase_stats.get()) is not None:
+        stats.edit_count += edit_count
+        stats.match_count += match_count
+
+
 def apply_edits(html: str, edits: list[AtomicEdit]) -> str:
     """Apply a list of atomic edits to the HTML string."""
 
+    record_stats(edit_count=len(edits))
+
     if not edits:
         return html
 
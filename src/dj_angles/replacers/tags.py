@@ -3,11 +3,10 @@ import re
 from collections import deque
 
 from django.template import Context, Origin, Template, TemplateDoesNotExist, TemplateSyntaxError
-from minestrone import HTML
 
 from dj_angles.exceptions import InvalidEndTagError
 from dj_angles.mappers.mapper import get_tag_map
-from dj_angles.replacers.objects import AtomicEdit, apply_edits
+from dj_angles.replacers.objects import AtomicEdit, apply_edits, record_stats
 from dj_angles.settings import get_setting, get_tag_regex
 from dj_angles.strings import replace_newlines
 from dj_angles.tags import Tag
@@ -47,8 +46,11 @@ def replace_tags(html: str, *, origin: Origin | None = None, raise_for_missing_s
     initial_tag_regex = get_setting("initial_tag_regex", default=r"(dj-)")
 
     matches_to_skip = 0
+    match_count = 0
 
     for match in re.finditer(tag_regex, html):
+        match_count += 1
+
         if matches_to_skip > 0:
             matches_to_skip -= 1
             continue
@@ -59,7 +61,7 @@ def replace_tags(html: str, *, origin: Origin | None = None, raise_for_missing_s
         template_tag_args = match.group("template_tag_args").strip()
         template_tag_args = replace_newlines(template_tag_args, " ")
 
-        if (map_explicit_tags_only or tag_map.get(None) is None) and tag_name.lower() not in tag_map:
+        if (map_explicit_tags_only or tag_map.get(None) is None) and not tag_map.is_mapped(tag_name):
             continue
 
         tag = Tag(
@@ -68,6 +70,7 @@ def replace_tags(html: str, *, origin: Origin | None = None, raise_for_missing_s
             tag_name=tag_name,
             template_tag_args=template_tag_args,
             tag_queue=tag_queue,
+            origin=origin,
         )
 
         if raise_for_missing_start_tag:
@@ -157,6 +160,9 @@ def replace_tags(html: str, *, origin: Origin | None = None, raise_for_missing_s
                         # If setting disabled, we do nothing with inner content here
                         # (inner tags will be processed by outer loop because matches_to_skip is not set).
 
+                        # Only import `minestrone` when slots get used because parsing HTML is otherwise not needed
+                        from minestrone import HTML  # noqa: PLC0415
+
                         found_slot = False
                         for element in HTML(inner_html).elements:
                             if slot_name := element.attributes.get("slot"):
@@ -188,4 +194,6 @@ def replace_tags(html: str, *, origin: Origin | None = None, raise_for_missing_s
                 )
             )
 
+    record_stats(match_count=match_count)
+
     return apply_edits(html, edits)
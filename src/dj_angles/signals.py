@@ -0,0 +1,13 @@
+from django.dispatch import Signal
+
+phase_converted = Signal()
+"""Sent after each phase of converting a template, e.g. `replace_tags`. Only sent when it has receivers.
+
+Keyword arguments:
+    - `phase`: the name of the phase, e.g. "replace_tags"
+    - `origin`: the origin of the template (can be `None`)
+    - `duration`: the duration of the phase in seconds
+    - `input_size`: the length of the template string that the phase converted
+    - `edit_count`: the number of edits the phase made
+    - `match_count`: the number of matches the phase found, e.g. tags for `replace_tags`
+"""
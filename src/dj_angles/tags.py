@@ -1,8 +1,8 @@
 import re
+from functools import lru_cache
 from typing import TYPE_CHECKING, Optional, cast
 
 from django.conf import settings
-from minestrone import Element
 
 from dj_angles.attributes import Attributes
 from dj_angles.caseconverter import kebabify
@@ -17,6 +17,9 @@ from dj_angles.templates import get_template
 if TYPE_CHECKING:
     from collections import deque
 
+    from django.template import Origin
+    from minestrone import Element
+
 
 SHADOW_ATTRIBUTE_KEY = "shadow"
 DEFAULT_ATTRIBUTE_KEY = "default"
@@ -24,6 +27,37 @@ DEFAULT_ATTRIBUTE_KEY = "default"
 ERROR_BOUNDARY_ATTRIBUTE_KEY = "error-boundary"
 ERROR_BOUNDARY_TAG_NAMES = ["block"]
 
+SEPARATORS_RE = re.compile(r"[/: ]+")
+HYPHENS_RE = re.compile(r"-+")
+
+
+@lru_cache(maxsize=512)
+def get_wrapping_tag_name(name: str) -> str:
+    """Get the wrapping tag name for a name, e.g. `dj-partial` for `'partial.html'`.
+
+    Cached because the same template names get wrapped over and over again.
+
+    Args:
+        param name: The name for the wrapping tag.
+    """
+
+    # Remove quotes
+    name = name.replace("'", "").replace('"', "")
+
+    # Replace separators with hyphens
+    name = SEPARATORS_RE.sub("-", name)
+
+    # Collapse multiple hyphens
+    name = HYPHENS_RE.sub("-", name)
+
+    wrapping_tag_name = f"dj-{name.lower()}"
+
+    # Remove extensions
+    (wrapping_tag_name, _, _) = wrapping_tag_name.partition(".")
+
+    # Remove shadow bang
+    return wrapping_tag_name.removesuffix("!")
+
 
 class Tag:
     """Encapsulates metadata and functionality for a tag that will be processed by `dj-angles`."""
@@ -68,6 +102,9 @@ class Tag:
 
     inner_html: str | None = None
 
+    origin: Optional["Origin"] = None
+    """The origin of the template that the tag is in."""
+
     def __init__(
         self,
         tag_map: TagMap | dict | None = None,
@@ -75,9 +112,12 @@ class Tag:
         tag_name: str = "",
         template_tag_args: str = "",
         tag_queue: Optional["deque"] = None,
+        *,
+        origin: Optional["Origin"] = None,
     ):
         self.html = html
         self.tag_name = tag_name
+        self.origin = origin
 
         self._template_tag_args = template_tag_args
         self.attributes = Attributes()
@@ -206,7 +246,7 @@ class Tag:
 
         return html
 
-    def get_django_template_tag(self, slots: list[tuple[str, Element]] | None = None) -> str:
+    def get_django_template_tag(self, slots: list[tuple[str, "Element"]] | None = None) -> str:
         """Generate the Django template tag.
 
         Args:
@@ -239,29 +279,7 @@ class Tag:
             param name: The name for the wrapping tag.
         """
 
-        name = name or self.tag_name
-
-        # Remove quotes
-        name = name.replace("'", "").replace('"', "")
-
-        # Replace separators with hyphens
-        name = re.sub(r"[/: ]+", "-", name)
-
-        # Collapse multiple hyphens
-        name = re.sub(r"-+", "-", name)
-
-        wrapping_tag_name = f"dj-{name.lower()}"
-
-        # Remove extensions
-        if "." in wrapping_tag_name:
-            extension_idx = wrapping_tag_name.index(".")
-            wrapping_tag_name = wrapping_tag_name[0:extension_idx]
-
-        # Remove shadow bang
-        if wrapping_tag_name.endswith("!"):
-            wrapping_tag_name = wrapping_tag_name[:-1]
-
-        return wrapping_tag_name
+        return get_wrapping_tag_name(name or self.tag_name)
 
     def pop_attribute_value_or_first_key(self, attribute_name: str) -> str:
         """Gets the first attribute key or the first value for a particular attribute name.
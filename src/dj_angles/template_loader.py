@@ -5,6 +5,7 @@ from django.template import TemplateDoesNotExist
 from django.template.loaders.app_directories import Loader as AppDirectoriesLoader
 
 from dj_angles.replacers import convert_template
+from dj_angles.timings import get_timings
 
 
 class Loader(AppDirectoriesLoader):
@@ -21,7 +22,12 @@ class Loader(AppDirectoriesLoader):
         """Gets the converted template contents."""
 
         template_string = self._get_template_string(origin.name)
-        converted_template_string = convert_template(template_string, origin=origin)
+
+        if (timings := get_timings()) is None:
+            return convert_template(template_string, origin=origin)
+
+        with timings.time("convert", origin.template_name or origin.name):
+            converted_template_string = convert_template(template_string, origin=origin)
 
         return converted_template_string
 
@@ -31,7 +37,7 @@ class Loader(AppDirectoriesLoader):
         From https://github.com/wrabit/django-cotton/blob/ab1a98052de48266c62ff226ab0ec85b89d038b6/django_cotton/cotton_loader.py#L59.
         """
 
-        dirs = self.engine.dirs
+        dirs = list(self.engine.dirs)
 
         for app_config in apps.get_app_configs():
             template_dir = os.path.join(app_config.path, "templates")
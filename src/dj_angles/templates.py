@@ -1,6 +1,9 @@
 from typing import Any
 
+from asgiref.sync import sync_to_async
+from django.template.context import make_context
 from django.template.exceptions import TemplateDoesNotExist
+from django.template.loader import get_template as get_django_template
 from django.template.loader import select_template
 
 from dj_angles.strings import dequotify
@@ -48,3 +51,30 @@ def get_template(template_file: str, *, raise_exception: bool = False) -> Any:
             raise
 
     return template
+
+
+async def arender_to_string(template_name: str, context: dict | None = None, request=None) -> str:
+    """Async version of Django's `render_to_string`.
+
+    All `view` template tags in the template that do not depend on the context are awaited concurrently on the
+    event loop before the template is rendered, so async views do not need to be run in a separate thread.
+
+    Args:
+        param template_name: The template name.
+        param context: The context dictionary.
+        param request: The request.
+
+    Returns:
+        The rendered template.
+    """
+
+    # Import here so that the template tags (and the evaluator) only get imported when they are needed
+    from dj_angles.templatetags.view import prefetch_views  # noqa: PLC0415
+
+    backend_template = get_django_template(template_name)
+    template = backend_template.template
+
+    django_context = make_context(context, request, autoescape=backend_template.backend.engine.autoescape)
+    await prefetch_views(template, django_context)
+
+    return await sync_to_async(template.render)(django_context)
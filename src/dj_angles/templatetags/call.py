@@ -1,14 +1,26 @@
 import inspect
 import logging
+from copy import copy
 
+from django.db.models import QuerySet
 from django.template import Context, Node, TemplateSyntaxError, Variable
 
 from dj_angles.evaluator import ParsedFunction, TemplateVariable, eval_value
 from dj_angles.templatetags.template import NodeListRenderer
+from dj_angles.timings import get_timings
 from dj_angles.tokenizer import yield_tokens
 
 logger = logging.getLogger(__name__)
 
+CALL_CACHE_KEY = "_dj_angles_call_cache"
+"""Attribute name (or render context key) where memoized `call` results are stored."""
+
+CALL_OPTIONS = ("cache", "stream", "chunk_size")
+"""Valid options for the `call` and `model` template tags."""
+
+DEFAULT_CHUNK_SIZE = 2000
+"""Number of rows fetched at a time for streamed querysets; the same default as `QuerySet.iterator`."""
+
 
 def get_tag_args(token, tag_name: str, min_args: int = 1) -> tuple[ParsedFunction, list[str], str | None]:
     """
@@ -55,6 +67,142 @@ def get_tag_args(token, tag_name: str, min_args: int = 1) -> tuple[ParsedFunctio
     return (parsed_function, args, context_variable_name)
 
 
+def get_tag_options(args: list[str], tag_name: str, valid_options: tuple[str, ...]) -> dict:
+    """
+    Parses the remaining template tag arguments into options, e.g. `cache`.
+
+    Args:
+        args: The template tag arguments that are not the function or the context variable.
+        tag_name: The name of the tag.
+        valid_options: The option names that are allowed for the tag.
+
+    Returns:
+        dict: The option names and values. Options without a value are `True`.
+    """
+
+    options = {}
+
+    for arg in args:
+        (name, _, value) = arg.partition("=")
+
+        if name not in valid_options:
+            raise TemplateSyntaxError(f"Invalid {tag_name} argument: {name}")
+
+        options[name] = eval_value(value) if value else True
+
+    return options
+
+
+def get_chunk_size(options: dict) -> int | None:
+    """Gets the chunk size for streaming querysets from the template tag options.
+
+    Returns:
+        The chunk size or `None` if the results should not be streamed.
+    """
+
+    chunk_size = options.get("chunk_size")
+
+    if chunk_size is not None:
+        if not isinstance(chunk_size, int) or isinstance(chunk_size, bool) or chunk_size < 1:
+            raise TemplateSyntaxError(f"Invalid chunk_size: {chunk_size}")
+
+        return chunk_size
+
+    if options.get("stream"):
+        return DEFAULT_CHUNK_SIZE
+
+    return None
+
+
+class QuerySetStream:
+    """Lazily iterates over a queryset in chunks, so the whole queryset is never loaded into memory."""
+
+    def __init__(self, queryset: QuerySet, chunk_size: int):
+        self.queryset = queryset
+        self.chunk_size = chunk_size
+        self.count: int | None = None
+
+    def __iter__(self):
+        return self.queryset.iterator(chunk_size=self.chunk_size)
+
+    def __len__(self) -> int:
+        # Django's `for` template tag converts objects without a length into a list, so use a `COUNT` query instead
+        if self.count is None:
+            self.count = self.queryset.count()
+
+        return self.count
+
+
+class Identity:
+    """
+    Wraps an unhashable value so it can be used in a cache key by its identity. The value is kept in the
+    wrapper, so it can't be garbage-collected and its id re-used while the key is in the cache.
+    """
+
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __hash__(self) -> int:
+        return id(self.value)
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, Identity) and other.value is self.value
+
+
+def freeze(value):
+    """
+    Converts a value into something hashable so it can be used in a cache key. Lists and dictionaries
+    are converted to tuples; anything else that is unhashable falls back to its identity.
+
+    Args:
+        param value: The value to freeze.
+
+    Returns:
+        A hashable representation of the value.
+    """
+
+    if isinstance(value, list | tuple):
+        return tuple(freeze(v) for v in value)
+    elif isinstance(value, dict):
+        return tuple((freeze(k), freeze(v)) for k, v in value.items())
+
+    try:
+        hash(value)
+    except TypeError:
+        return Identity(value)
+
+    return value
+
+
+def get_call_cache(context) -> dict:
+    """
+    Gets the storage for memoized `call` results. Results are stored on the request so they last for
+    the duration of the request (across includes). If there is no request, they are stored in the
+    render context for the duration of the render.
+
+    Args:
+        param context: The template context.
+
+    Returns:
+        dict: The memoized results.
+    """
+
+    request = context.get("request")
+
+    if request is not None:
+        if not hasattr(request, CALL_CACHE_KEY):
+            setattr(request, CALL_CACHE_KEY, {})
+
+        return getattr(request, CALL_CACHE_KEY)
+
+    render_context = getattr(context, "render_context", context)
+
+    # The first dictionary is shared by every template rendered with the context
+    return render_context.dicts[0].setdefault(CALL_CACHE_KEY, {})
+
+
 def resolve(context, arg):
     """
     Resolves a template variable based on the context if it's a `TemplateVariable`. Otherwise,
@@ -85,9 +233,26 @@ def resolve(context, arg):
 
 
 class CallNode(Node):
-    def __init__(self, parsed_function, context_variable_name):
+    timing_name = "call"
+    """The name used when collecting timings for the template tag."""
+
+    def __init__(self, parsed_function, context_variable_name, *, cache: bool = False, chunk_size: int | None = None):
         self.parsed_function = parsed_function
         self.context_variable_name = context_variable_name
+        self.cache = cache
+        self.chunk_size = chunk_size
+
+    def render_annotated(self, context):
+        if (timings := get_timings()) is None:
+            return super().render_annotated(context)
+
+        with timings.time(self.timing_name, self.parsed_function.function_name):
+            return super().render_annotated(context)
+
+    def get_root(self, context):
+        """Gets the object that the first portion of the parsed function refers to."""
+
+        return context.get(self.parsed_function.portions[0].name)
 
     def resolve_args(self, context, portion):
         args = portion.args
@@ -142,7 +307,7 @@ class CallNode(Node):
         result = None
 
         if obj is None:
-            result = context.get(portion.name)
+            result = self.get_root(context)
         elif callable(obj):
             result = obj
 
@@ -151,9 +316,66 @@ class CallNode(Node):
 
         return result
 
+    def get_cache_key(self, context) -> tuple:
+        """Builds a key for memoizing the result based on the resolved object and arguments."""
+
+        portions = self.parsed_function.portions
+
+        key: list = [self.__class__.__name__, freeze(self.get_root(context))]
+
+        for portion in portions:
+            args = self.resolve_args(context, portion)
+            kwargs = self.resolve_kwargs(context, portion)
+
+            key.append((portion.name, freeze(args), freeze(kwargs)))
+
+        return tuple(key)
+
+    def get_cached_value(self, context) -> tuple:
+        """Gets the memoized value for the call if it is available; otherwise, evaluate and store it."""
+
+        key = self.get_cache_key(context)
+        cache = get_call_cache(context)
+
+        if key in cache:
+            return cache[key]
+
+        (value, is_rendered) = self.get_value(context)
+
+        # Rendered templates can depend on the context, so never re-use them
+        if not is_rendered:
+            cache[key] = (value, is_rendered)
+
+        return (value, is_rendered)
+
     def render(self, context):
         """Execute the function with the provided arguments and stores the results in context."""
 
+        if self.cache:
+            (obj, is_rendered) = self.get_cached_value(context)
+        else:
+            (obj, is_rendered) = self.get_value(context)
+
+        if is_rendered:
+            return obj
+
+        if self.chunk_size is not None and isinstance(obj, QuerySet):
+            obj = QuerySetStream(obj, self.chunk_size)
+
+        if self.context_variable_name is not None:
+            context.push({self.context_variable_name: obj})
+            return ""
+
+        # Must render a string
+        return str(obj)
+
+    def get_value(self, context) -> tuple:
+        """Execute the function with the provided arguments.
+
+        Returns:
+            A tuple of the result and whether the result is already rendered template output.
+        """
+
         obj = None
 
         for idx, portion in enumerate(self.parsed_function.portions):
@@ -169,25 +391,21 @@ class CallNode(Node):
             elif isinstance(obj, NodeListRenderer):
                 renderer = obj
 
-                if len(renderer.parsed_function.portions) > 1:
-                    raise TemplateSyntaxError("Invalid template renderer")
-
-                template_context = {}
-                template_last_portion = renderer.parsed_function.portions[-1]
-
-                for key, value in template_last_portion.kwargs.items():
-                    template_context[key] = resolve(context, value)
-
                 if len(self.parsed_function.portions) > 1:
                     raise TemplateSyntaxError("Invalid template call")
 
                 call_last_portion = self.parsed_function.portions[-1]
 
-                if len(template_last_portion.args) != len(call_last_portion.args):
+                if len(renderer.arg_names) != len(call_last_portion.args):
                     raise TemplateSyntaxError("Invalid number of arguments")
 
-                for arg_idx, arg in enumerate(call_last_portion.args):
-                    arg_name = template_last_portion.args[arg_idx].name
+                # Bind the arguments with the plan that was built when the template was compiled
+                template_context = renderer.defaults.copy()
+
+                for key, value in renderer.variable_defaults.items():
+                    template_context[key] = resolve(context, value)
+
+                for arg_name, arg in zip(renderer.arg_names, call_last_portion.args, strict=True):
                     template_context[arg_name] = resolve(context, arg)
 
                 for key, value in call_last_portion.kwargs.items():
@@ -196,20 +414,17 @@ class CallNode(Node):
                 node_list_context = Context({})
 
                 if renderer.include_context:
-                    node_list_context = Context(context.flatten())
+                    # Share the layers of the context instead of flattening them into a new context; the template
+                    # context gets pushed onto its own layer, so the original context never gets changed
+                    node_list_context = copy(context)
                 else:
                     node_list_context.template = context.template
 
                 node_list_context.update(template_context)
 
-                return renderer.render(node_list_context)
+                return (renderer.render(node_list_context), True)
 
-        if self.context_variable_name is not None:
-            context.push({self.context_variable_name: obj})
-            return ""
-
-        # Must render a string
-        return str(obj)
+        return (obj, False)
 
 
 def do_call(parser, token) -> CallNode:  # noqa: ARG001
@@ -229,8 +444,16 @@ def do_call(parser, token) -> CallNode:  # noqa: ARG001
         - "call model.some_function('hello goodbye') as output_variable"
         - "call model.some_function('hello', 2) as output_variable"
         - "call model.some_function(arg1, arg2) as output_variable"
+        - "call model.some_function(arg1, arg2) cache as output_variable"
+        - "call model.some_queryset() chunk_size=500 as output_variable"
     """
 
-    (parsed_function, _, context_variable_name) = get_tag_args(token, "call")
+    (parsed_function, args, context_variable_name) = get_tag_args(token, "call")
+    options = get_tag_options(args, "call", CALL_OPTIONS)
 
-    return CallNode(parsed_function, context_variable_name)
+    return CallNode(
+        parsed_function,
+        context_variable_name,
+        cache=options.get("cache", False),
+        chunk_size=get_chunk_size(options),
+    )
@@ -1,64 +1,102 @@
-import logging
+from django.db.models.manager import BaseManager
+from django.template import TemplateSyntaxError
 
-from django.apps import apps
+from dj_angles.model_registry import get_model_registry
+from dj_angles.templatetags.call import CALL_OPTIONS, CallNode, get_chunk_size, get_tag_args, get_tag_options
 
-from dj_angles.evaluator import Portion
-from dj_angles.templatetags.call import CallNode, do_call
+MODEL_OPTIONS = (*CALL_OPTIONS, "related", "prefetch")
 
-logger = logging.getLogger(__name__)
 
-"""
-Global storage of all available models.
-"""
-models = None
+def get_lookups(value) -> tuple[str, ...]:
+    """Normalizes a `related` or `prefetch` option value, i.e. a string or a list of strings, into a tuple."""
 
+    if value is None:
+        return ()
 
-def get_models() -> dict:
-    models = {}
+    if isinstance(value, str):
+        return (value,)
 
-    for app_config in apps.get_app_configs():
-        app_label = app_config.label
+    return tuple(value)
 
-        if app_label not in models:
-            models[app_label] = {}
 
-        for model in app_config.get_models():
-            model_name = model.__name__
+class ModelNode(CallNode):
+    timing_name = "model"
 
-            if model_name in models:
-                if isinstance(models[model_name], dict):
-                    logger.warning("Model name collision with app label: %s", model_name)
-                else:
-                    logger.warning("Model name collision: %s. Using %s.", model_name, app_label)
+    def __init__(
+        self,
+        parsed_function,
+        context_variable_name,
+        *,
+        model,
+        cache: bool = False,
+        chunk_size: int | None = None,
+        related: tuple[str, ...] = (),
+        prefetch: tuple[str, ...] = (),
+    ):
+        super().__init__(parsed_function, context_variable_name, cache=cache, chunk_size=chunk_size)
 
-            models[model_name] = model
-            models[app_label][model_name] = model
+        self.model = model
+        self.related = related
+        self.prefetch = prefetch
 
-    return models
+    def get_root(self, context):  # noqa: ARG002
+        return self.model
 
+    def get_result(self, context, obj, portion):
+        manager = getattr(obj, "__self__", None)
 
-def clear_models() -> None:
-    global models  # noqa: PLW0603
-    models = None
+        # Call the manager method on a queryset with the related lookups, e.g. `Book.objects.filter()`,
+        # so they apply to the rest of the chain including methods that do not return a queryset like `first()`
+        if (self.related or self.prefetch) and isinstance(manager, BaseManager):
+            queryset = manager.get_queryset()
 
+            if hasattr(queryset, portion.name):
+                if self.related:
+                    queryset = queryset.select_related(*self.related)
 
-class ModelNode(CallNode):
-    def render(self, context):
-        global models  # noqa: PLW0603
+                if self.prefetch:
+                    queryset = queryset.prefetch_related(*self.prefetch)
+
+                obj = getattr(queryset, portion.name)
+
+        return super().get_result(context, obj, portion)
+
+
+def do_model(parser, token) -> ModelNode:  # noqa: ARG001
+    """
+    Parses the token to get the model and all the pieces needed to call the function.
+
+    Examples:
+        - "model Book.objects.filter(published=True) as books"
+        - "model book.Book.objects.all() related='publisher' prefetch=['authors'] as books"
+    """
+
+    (parsed_function, args, context_variable_name) = get_tag_args(token, "model")
+    options = get_tag_options(args, "model", MODEL_OPTIONS)
 
-        if models is None:
-            models = get_models()
+    portions = parsed_function.portions
 
-        context["__dj_angles_models"] = models
+    # Look up the model when the template is compiled so rendering starts directly at the model
+    model = get_model_registry().get(portions[0].name)
 
-        return super().render(context)
+    if isinstance(model, dict):
+        # The first portion is an app label, e.g. `{% model book.Book.objects.all() %}`
+        app_label = portions.pop(0).name
 
+        if not portions:
+            raise TemplateSyntaxError(f"Invalid model: {app_label}")
 
-def do_model(parser, token) -> ModelNode:
-    call_node = do_call(parser, token)
+        model = model.get(portions[0].name)
 
-    # Models are stored in a special part of the context so it doesn't conflict with other data
-    # so add this fake object name because we will use it in the render method
-    call_node.parsed_function.portions.insert(0, Portion(name="__dj_angles_models"))
+    if model is None:
+        raise TemplateSyntaxError(f"Invalid model: {portions[0].name}")
 
-    return ModelNode(call_node.parsed_function, call_node.context_variable_name)
+    return ModelNode(
+        parsed_function,
+        context_variable_name,
+        model=model,
+        cache=options.get("cache", False),
+        chunk_size=get_chunk_size(options),
+        related=get_lookups(options.get("related")),
+        prefetch=get_lookups(options.get("prefetch")),
+    )
@@ -2,7 +2,7 @@ import logging
 
 from django.template import Node, NodeList, TemplateSyntaxError
 
-from dj_angles.evaluator import ParsedFunction
+from dj_angles.evaluator import ParsedFunction, TemplateVariable, eval_value
 from dj_angles.tokenizer import yield_tokens
 
 logger = logging.getLogger(__name__)
@@ -14,6 +14,23 @@ class NodeListRenderer:
         self.parsed_function = parsed_function
         self.include_context = include_context
 
+        if len(self.parsed_function.portions) > 1:
+            raise TemplateSyntaxError("Invalid template renderer")
+
+        portion = self.parsed_function.portions[-1]
+
+        # Build how arguments get bound when the template is called, so that only needs to happen once
+        self.arg_names = tuple(arg.name for arg in portion.args)
+        self.defaults = {}
+        self.variable_defaults = {}
+
+        for key, value in portion.kwargs.items():
+            if isinstance(value, TemplateVariable):
+                # Template variable defaults get resolved with the context of the call
+                self.variable_defaults[key] = value
+            else:
+                self.defaults[key] = eval_value(value)
+
     def render(self, context: dict) -> str:
         return str(self.nodelist.render(context))
 
@@ -24,21 +41,14 @@ class TemplateNode(Node):
         self.parsed_function = parsed_function
         self.include_context = include_context
 
+        self.renderer = NodeListRenderer(self.nodelist, self.parsed_function, include_context=self.include_context)
+
     def render(self, context):
         """Execute the function with the provided arguments and stores the results in context."""
 
-        if len(self.parsed_function.portions) > 1:
-            raise TemplateSyntaxError("Invalid template renderer")
-
         last_portion = self.parsed_function.portions[-1]
 
-        context.push(
-            {
-                last_portion.name: NodeListRenderer(
-                    self.nodelist, self.parsed_function, include_context=self.include_context
-                )
-            }
-        )
+        context.push({last_portion.name: self.renderer})
 
         # Must render a string
         return ""
@@ -1,22 +1,244 @@
 import ast
+import asyncio
+import hashlib
 import inspect
 import logging
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextvars import ContextVar, copy_context
+from datetime import date, time, tzinfo
+from decimal import Decimal
+from http import HTTPStatus
+from uuid import UUID
 
-from django.template import TemplateSyntaxError
-from django.urls import NoReverseMatch, resolve, reverse
+from asgiref.sync import async_to_sync, iscoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.cache import DEFAULT_CACHE_ALIAS, caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.db import connections
+from django.db.models import Model
+from django.http import HttpResponse
+from django.template import Context, Node, TemplateSyntaxError
+from django.template.defaulttags import AutoEscapeControlNode, FilterNode, SpacelessNode, WithNode
+from django.urls import NoReverseMatch, get_urlconf, reverse, set_urlconf
+from django.urls import resolve as resolve_url
+from django.utils import timezone, translation
 from django.utils.module_loading import import_string
 from django.views import View
 
-from dj_angles.evaluator import eval_value
-from dj_angles.templatetags.call import CallNode, get_tag_args
+from dj_angles.evaluator import TemplateVariable, eval_value
+from dj_angles.settings import get_setting
+from dj_angles.templatetags.call import CallNode, get_tag_args, resolve
 
 logger = logging.getLogger(__name__)
 
+VIEW_FUTURES_KEY = "dj_angles_view_futures"
+"""Render context key where the futures for views that were started before being rendered are stored."""
+
+VIEW_TEMPLATES_KEY = "dj_angles_view_templates"
+"""Render context key where the templates that have had their views started are stored."""
+
+ALWAYS_RENDERED_NODES: tuple[type[Node], ...] = (WithNode, AutoEscapeControlNode, SpacelessNode, FilterNode)
+"""Nodes that always render their children once, so the views inside of them can be started early."""
+
+is_view_thread: ContextVar[bool] = ContextVar("dj_angles_is_view_thread", default=False)
+"""Whether a view is being rendered in the thread pool. Views in the templates it renders are not started
+concurrently, because waiting on the same thread pool could deadlock once all of its workers are busy."""
+
+"""
+Global thread pool for concurrently rendered views.
+"""
+executor: ThreadPoolExecutor | None = None
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """Get the thread pool used to render views concurrently."""
+
+    global executor  # noqa: PLW0603
+
+    if executor is None:
+        max_workers = get_setting(key_path="views", setting_name="max_workers", default=None)
+        executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="dj_angles_view")
+
+    return executor
+
+
+def has_template_variable(value) -> bool:
+    """Whether the value is, or contains, a template variable that needs the context to be resolved."""
+
+    if isinstance(value, TemplateVariable):
+        return True
+    elif isinstance(value, list | tuple):
+        return any(has_template_variable(v) for v in value)
+    elif isinstance(value, dict):
+        return any(has_template_variable(k) or has_template_variable(v) for k, v in value.items())
+
+    return False
+
+
+def get_cache_key_value(value):
+    """Converts a value into stable primitives for the cache key of a view.
+
+    Model instances are converted to their label and primary key because their `repr` is based on `__str__`,
+    so two different objects could share the same key.
+
+    Raises:
+        TypeError: If the value cannot be converted, e.g. an object with the default `repr` that is based on its
+            memory address or a model instance that has not been saved.
+    """
+
+    if value is None or isinstance(value, str | int | float):
+        return value
+    elif isinstance(value, date | time | Decimal | UUID):
+        return (type(value).__name__, str(value))
+    elif isinstance(value, Model):
+        if value.pk is None:
+            raise TypeError(f"Unsaved {value._meta.label} cannot be used in a view cache key")
+
+        return (value._meta.label_lower, get_cache_key_value(value.pk))
+    elif isinstance(value, list | tuple):
+        return tuple(get_cache_key_value(v) for v in value)
+    elif isinstance(value, dict):
+        return tuple(sorted(((get_cache_key_value(k), get_cache_key_value(v)) for k, v in value.items()), key=repr))
+
+    raise TypeError(f"{type(value).__name__} cannot be used in a view cache key")
+
+
+def render_view_in_thread(
+    node: "ViewNode", context, urlconf: str | None, language: str | None, current_timezone: tzinfo
+) -> str:
+    """Renders the view in a worker thread with the same URLconf, language, and timezone as the rendering thread."""
+
+    set_urlconf(urlconf)
+    is_view_thread.set(True)
+
+    try:
+        with translation.override(language), timezone.override(current_timezone):
+            return node.get_content(context)
+    finally:
+        set_urlconf(None)
+
+        # Database connections are per-thread, so close the ones opened by the view
+        connections.close_all()
+
+
+def get_startable_view_nodes(nodelist) -> list["ViewNode"]:
+    """Gets the view nodes that do not depend on the context and are always rendered with the template, i.e. the
+    ones that are at the top-level of the template or only inside of nodes like `with`. Views inside of any other
+    node, e.g. `if` or `cache`, might not get rendered, so they are skipped.
+    """
+
+    nodes = []
+
+    for node in nodelist:
+        if isinstance(node, ViewNode):
+            if node.is_constant:
+                nodes.append(node)
+
+            continue
+
+        if not isinstance(node, ALWAYS_RENDERED_NODES):
+            continue
+
+        for attr in node.child_nodelists:
+            if child_nodelist := getattr(node, attr, None):
+                nodes.extend(get_startable_view_nodes(child_nodelist))
+
+    return nodes
+
+
+def get_view_futures(context) -> dict["ViewNode", Future]:
+    """Get the futures for views that were started before their node was rendered.
+
+    They are stored in the first dictionary of the render context so they are available to every
+    template that gets rendered with the context.
+    """
+
+    return context.render_context.dicts[0].setdefault(VIEW_FUTURES_KEY, {})
+
+
+def start_views(context, futures: dict["ViewNode", Future]) -> None:
+    """Starts rendering all of the views in the current template that do not depend on the context and are not inside
+    of a conditional node."""
+
+    template = context.render_context.template
+    templates = context.render_context.dicts[0].setdefault(VIEW_TEMPLATES_KEY, set())
+
+    if template is None or template in templates:
+        return
+
+    templates.add(template)
+
+    urlconf = get_urlconf()
+    language = translation.get_language()
+    current_timezone = timezone.get_current_timezone()
+
+    # The rendering thread keeps changing its context, so the views get their own; constant views only need the request
+    view_context = Context({"request": context["request"]})
+
+    for node in get_startable_view_nodes(template.nodelist):
+        if node not in futures:
+            # Run in a copy of the context variables, e.g. so the timings of `ServerTimingMiddleware` are collected
+            futures[node] = get_executor().submit(
+                copy_context().run, render_view_in_thread, node, view_context, urlconf, language, current_timezone
+            )
+
+
+async def prefetch_views(template, context) -> None:
+    """Awaits all of the views in the template that do not depend on the context and are not inside of a conditional
+    node concurrently and stores the rendered content so the view nodes do not have to call the views when the
+    template is rendered.
+
+    Args:
+        param template: The compiled template.
+        param context: The context the template will be rendered with.
+    """
+
+    # `RequestContext` only adds the request to the context when the template gets bound to it
+    request = getattr(context, "request", None) or context.get("request")
+
+    if request is None:
+        return
+
+    futures = get_view_futures(context)
+    nodes = get_startable_view_nodes(template.nodelist)
+
+    # Constant views only need the request from the context
+    view_context = Context({"request": request})
+    results = await asyncio.gather(*[node.aget_content(view_context) for node in nodes], return_exceptions=True)
+
+    for node, result in zip(nodes, results, strict=True):
+        future: Future = Future()
+
+        if isinstance(result, BaseException):
+            future.set_exception(result)
+        else:
+            future.set_result(result)
+
+        futures[node] = future
+
 
 class ViewNode(CallNode):
-    def render(self, context):
-        if "request" not in context:
-            return ""
+    timing_name = "view"
+
+    def __init__(self, parsed_function, context_variable_name, *, cache_timeout=None, vary=None):
+        super().__init__(parsed_function, context_variable_name)
+
+        self.cache_timeout = cache_timeout
+        self.vary = vary
+
+        # Views that do not use any template variables can be rendered before the node is reached
+        self.is_constant = not any(
+            has_template_variable(portion.args) or has_template_variable(portion.kwargs)
+            for portion in self.parsed_function.portions
+        ) and not has_template_variable([cache_timeout, vary])
+
+        # Cache of the found view, keyed by the URLconf, for constant nodes
+        self.views: dict[str, tuple[Callable, list | tuple, dict]] = {}
+        self.imported_view: Callable | None = None
+
+    def resolve_arguments(self, context) -> tuple[str, list, dict]:
+        """Resolves the full path of the view and the args and kwargs passed into the template tag."""
 
         path_parts = []
         args = []
@@ -34,57 +256,234 @@ class ViewNode(CallNode):
         full_path = ".".join(path_parts)
         full_path = full_path.replace("'", "").replace('"', "")
 
+        return (full_path, args, kwargs)
+
+    def get_view(self, full_path: str, args: list, kwargs: dict) -> tuple[Callable, list | tuple, dict]:
+        """Gets the view function for the path and the args and kwargs to call it with.
+
+        The view for nodes that do not use template variables only gets looked up once per URLconf.
+        """
+
+        if not self.is_constant:
+            return self.find_view(full_path, args, kwargs)
+
+        urlconf = get_urlconf() or settings.ROOT_URLCONF
+
+        if (view := self.views.get(urlconf)) is None:
+            view = self.find_view(full_path, args, kwargs)
+            self.views[urlconf] = view
+
+        return view
+
+    def find_view(self, full_path: str, args: list, kwargs: dict) -> tuple[Callable, list | tuple, dict]:
+        """Finds the view function for the path either by reversing a URL name or importing it.
+
+        Returns:
+            A tuple of the view function and the args and kwargs to call it with.
+        """
+
         # Try to reverse the name to find the view
         # We use strict arguments matching for reverse
-        resolved_view = None
-        resolved_args = []
-        resolved_kwargs = {}
-
         try:
             # If kwargs are provided, reverse prefers them over args usually,
             # but we pass what we have.
             url = reverse(full_path, args=args, kwargs=kwargs)
-            match = resolve(url)
-            resolved_view = match.func
-            resolved_args = match.args
-            resolved_kwargs = match.kwargs
+            match = resolve_url(url)
+
+            # We use the args/kwargs from the RESOLVED url, not the ones passed to the tag,
+            # because the tag args were consumed to make the URL.
+            return (match.func, match.args, match.kwargs)
         except NoReverseMatch:
             # Fallback to import_string
             pass
 
-        if resolved_view:
-            view_func = resolved_view
-            # We use the args/kwargs from the RESOLVED url, not the ones passed to the tag,
-            # because the tag args were consumed to make the URL.
-            args = resolved_args
-            kwargs = resolved_kwargs
+        return (self.import_view(full_path), args, kwargs)
+
+    def import_view(self, full_path: str) -> Callable:
+        """Imports the view function for the path. The imported view does not depend on the arguments, so it only
+        gets imported (and class-based views only get instantiated with `as_view`) once per node.
+        """
+
+        if self.imported_view is not None:
+            return self.imported_view
+
+        try:
+            obj = import_string(full_path)
+        except ImportError:
+            if "." in full_path:
+                try:
+                    parent, method = full_path.rsplit(".", 1)
+                    parent_obj = import_string(parent)
+                    obj = getattr(parent_obj, method)
+                except (ImportError, AttributeError) as e:
+                    raise ImportError(f"Could not import {full_path}") from e
+            else:
+                raise
+
+        view_func = obj
+
+        # Handle class-based views for imported objects
+        if isinstance(obj, type) and issubclass(obj, View):
+            view_func = obj.as_view()
+        elif callable(obj) and getattr(obj, "__name__", "") == "as_view" and inspect.ismethod(obj):
+            view_func = obj()
+
+        self.imported_view = view_func
+
+        return view_func
+
+    def get_response(self, context, full_path: str, args: list, kwargs: dict) -> HttpResponse:
+        """Calls the view and renders the response if needed."""
+
+        (view_func, args, kwargs) = self.get_view(full_path, args, kwargs)
+
+        if iscoroutinefunction(view_func):
+            response = async_to_sync(view_func)(context["request"], *args, **kwargs)
         else:
-            try:
-                obj = import_string(full_path)
-            except ImportError:
-                if "." in full_path:
-                    try:
-                        parent, method = full_path.rsplit(".", 1)
-                        parent_obj = import_string(parent)
-                        obj = getattr(parent_obj, method)
-                    except (ImportError, AttributeError) as e:
-                        raise ImportError(f"Could not import {full_path}") from e
-                else:
-                    raise
-            view_func = obj
-
-            # Handle class-based views for imported objects
-            if isinstance(obj, type) and issubclass(obj, View):
-                view_func = obj.as_view()
-            elif callable(obj) and getattr(obj, "__name__", "") == "as_view" and inspect.ismethod(obj):
-                view_func = obj()
-
-        response = view_func(context["request"], *args, **kwargs)
+            response = view_func(context["request"], *args, **kwargs)
 
         if hasattr(response, "render"):
             response.render()
 
-        content = response.content.decode("utf-8")
+        return response
+
+    async def aget_response(self, context, full_path: str, args: list, kwargs: dict) -> HttpResponse:
+        """Awaits async views directly on the event loop; sync views are called in a thread."""
+
+        (view_func, args, kwargs) = self.get_view(full_path, args, kwargs)
+
+        if iscoroutinefunction(view_func):
+            response = await view_func(context["request"], *args, **kwargs)
+        else:
+            response = await sync_to_async(view_func)(context["request"], *args, **kwargs)
+
+        if hasattr(response, "render"):
+            await sync_to_async(response.render)()
+
+        return response
+
+    def get_content_cache_key(self, context, full_path: str, args: list, kwargs: dict) -> str | None:
+        """Builds a cache key for the rendered content based on the view, its arguments and the vary values.
+
+        Returns:
+            The cache key or `None` if the arguments or vary values cannot be used in a cache key.
+        """
+
+        if isinstance(self.vary, list):
+            vary = [resolve(context, v) for v in self.vary]
+        else:
+            vary = resolve(context, self.vary)
+
+        try:
+            key = repr(get_cache_key_value((full_path, args, kwargs, vary)))
+        except TypeError as e:
+            logger.debug("Not caching view %s: %s", full_path, e)
+            return None
+
+        return f"dj_angles.view.{hashlib.sha256(key.encode()).hexdigest()}"
+
+    def get_cached_content(self, context, full_path: str, args: list, kwargs: dict) -> str:
+        """Gets the rendered content from the cache or renders the view and caches successful responses. Views with
+        arguments that cannot be used in a cache key are not cached."""
+
+        cache_key = self.get_content_cache_key(context, full_path, args, kwargs)
+
+        if cache_key is None:
+            return self.get_response(context, full_path, args, kwargs).content.decode("utf-8")
+
+        cache = caches[get_setting(key_path="views", setting_name="cache_alias", default=DEFAULT_CACHE_ALIAS)]
+        cache_timeout = resolve(context, self.cache_timeout)
+
+        content = cache.get(cache_key)
+
+        if content is None:
+            response = self.get_response(context, full_path, args, kwargs)
+            content = response.content.decode("utf-8")
+
+            if response.status_code == HTTPStatus.OK:
+                cache.set(cache_key, content, cache_timeout)
+
+        return content
+
+    async def aget_cached_content(self, context, full_path: str, args: list, kwargs: dict) -> str:
+        """Async version of `get_cached_content`."""
+
+        cache_key = self.get_content_cache_key(context, full_path, args, kwargs)
+
+        if cache_key is None:
+            return (await self.aget_response(context, full_path, args, kwargs)).content.decode("utf-8")
+
+        cache = caches[get_setting(key_path="views", setting_name="cache_alias", default=DEFAULT_CACHE_ALIAS)]
+        cache_timeout = resolve(context, self.cache_timeout)
+
+        content = await cache.aget(cache_key)
+
+        if content is None:
+            response = await self.aget_response(context, full_path, args, kwargs)
+            content = response.content.decode("utf-8")
+
+            if response.status_code == HTTPStatus.OK:
+                await cache.aset(cache_key, content, cache_timeout)
+
+        return content
+
+    def get_content(self, context) -> str:
+        """Gets the rendered content of the view."""
+
+        (full_path, args, kwargs) = self.resolve_arguments(context)
+
+        if self.cache_timeout is not None:
+            return self.get_cached_content(context, full_path, args, kwargs)
+
+        response = self.get_response(context, full_path, args, kwargs)
+
+        return response.content.decode("utf-8")
+
+    async def aget_content(self, context) -> str:
+        """Async version of `get_content`."""
+
+        (full_path, args, kwargs) = self.resolve_arguments(context)
+
+        if self.cache_timeout is not None:
+            return await self.aget_cached_content(context, full_path, args, kwargs)
+
+        response = await self.aget_response(context, full_path, args, kwargs)
+
+        return response.content.decode("utf-8")
+
+    def get_started_content(self, context) -> str | None:
+        """Gets the content of the view if it was started before the node was rendered, either concurrently with
+        the other views in the template or by `prefetch_views`.
+
+        When concurrent rendering is enabled, the first view node that gets rendered starts all of the views in
+        the template, unless the template is rendered by a view that is already in the thread pool.
+        """
+
+        futures = get_view_futures(context)
+
+        if (
+            self not in futures
+            and not is_view_thread.get()
+            and get_setting(key_path="views", setting_name="concurrent", default=False)
+        ):
+            start_views(context, futures)
+
+        if (future := futures.get(self)) is None:
+            return None
+
+        return future.result()
+
+    def render(self, context):
+        if "request" not in context:
+            return ""
+
+        content = None
+
+        if self.is_constant:
+            content = self.get_started_content(context)
+
+        if content is None:
+            content = self.get_content(context)
 
         # Store rendered content in the context if a variable name was specified
         if self.context_variable_name:
@@ -112,6 +511,11 @@ def do_view(parser, token) -> ViewNode:  # noqa: ARG001
     extra_kwargs = {}
 
     for arg in args:
+        # A bare `cache` caches the view with the default timeout of the cache
+        if arg == "cache":
+            extra_kwargs["cache"] = DEFAULT_TIMEOUT
+            continue
+
         # Parse the argument (literals, variables, etc)
         try:
             # Wrap the argument in a function call to easily parse both args and kwargs using AST
@@ -130,9 +534,16 @@ def do_view(parser, token) -> ViewNode:  # noqa: ARG001
         except SyntaxError as e:
             raise TemplateSyntaxError(f"Could not parse argument: {arg}") from e
 
+    # `cache` and `vary` are options for the template tag and are not passed to the view
+    cache_timeout = extra_kwargs.pop("cache", None)
+    vary = extra_kwargs.pop("vary", None)
+
+    if vary is not None and cache_timeout is None:
+        raise TemplateSyntaxError("view template tag requires 'cache' to use 'vary'")
+
     # Append extra args and kwargs to the last portion of the parsed function
     if parsed_function.portions:
         parsed_function.portions[-1].args.extend(extra_args)
         parsed_function.portions[-1].kwargs.update(extra_kwargs)
 
-    return ViewNode(parsed_function, context_variable_name)
+    return ViewNode(parsed_function, context_variable_name, cache_timeout=cache_timeout, vary=vary)
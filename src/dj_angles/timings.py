@@ -0,0 +1,79 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import perf_counter
+
+
+class Timings:
+    """Collects how long `dj-angles` spends on each type of work, e.g. converting templates or rendering the `call`
+    template tag.
+    """
+
+    def __init__(self):
+        self.events: list[tuple[str, str, float]] = []
+        """Each timing as a tuple of the name, a label (e.g. the template name), and the duration in seconds."""
+
+    def add(self, name: str, label: str, duration: float) -> None:
+        self.events.append((name, label, duration))
+
+    @contextmanager
+    def time(self, name: str, label: str) -> Iterator[None]:
+        """Times the code inside of the context manager.
+
+        Args:
+            param name: The type of work, e.g. "convert" or "call".
+            param label: What the work was for, e.g. the template name.
+        """
+
+        start = perf_counter()
+
+        try:
+            yield
+        finally:
+            self.add(name, label, perf_counter() - start)
+
+    def get_totals(self) -> dict[str, tuple[int, float]]:
+        """Gets the count and total duration in seconds for each type of work."""
+
+        totals: dict[str, tuple[int, float]] = {}
+
+        for name, _, duration in self.events:
+            (count, total) = totals.get(name, (0, 0.0))
+            totals[name] = (count + 1, total + duration)
+
+        return totals
+
+    def get_server_timing(self) -> str:
+        """Gets the timings in the format of the `Server-Timing` header.
+
+        Example:
+            - `angles-call;dur=1.25;desc="call (3)"`
+        """
+
+        return ", ".join(
+            f'angles-{name};dur={total * 1000:.2f};desc="{name} ({count})"'
+            for name, (count, total) in self.get_totals().items()
+        )
+
+
+timings: ContextVar[Timings | None] = ContextVar("dj_angles_timings", default=None)
+"""The timings for the current request. `None` unless they are being collected, e.g. by `ServerTimingMiddleware`."""
+
+
+def get_timings() -> Timings | None:
+    """Gets the timings that are currently being collected or `None` if they are not being collected."""
+
+    return timings.get()
+
+
+@contextmanager
+def collect_timings() -> Iterator[Timings]:
+    """Collects timings for the code inside of the context manager."""
+
+    collected = Timings()
+    token = timings.set(collected)
+
+    try:
+        yield collected
+    finally:
+        timings.reset(token)
@@ -1,6 +1,9 @@
+from unittest.mock import patch
+
 import pytest
 
 from dj_angles.caseconverter import kebabify
+from dj_angles.caseconverter.kebab import _kebabify
 
 
 @pytest.mark.parametrize(
@@ -50,3 +53,39 @@ def test_default(test_case, expect):
 )
 def test_keep_punctuation(test_case, expect):
     assert kebabify(test_case, strip_punctuation=False) == expect
+
+
+@pytest.mark.parametrize(
+    "test_case",
+    [
+        "hello",
+        "hello-world",
+        "item-1",
+        "h1",
+        "error-boundary",
+    ],
+)
+def test_already_kebab_case(test_case):
+    with patch("dj_angles.caseconverter.kebab.Kebab") as kebab:
+        assert kebabify(test_case) == test_case
+        assert kebabify(test_case, strip_punctuation=False) == test_case
+
+    kebab.assert_not_called()
+
+
+def test_cached():
+    _kebabify.cache_clear()
+
+    with patch("dj_angles.caseconverter.kebab.Kebab") as kebab:
+        kebab.return_value.convert.return_value = "partial-one"
+
+        assert kebabify("PartialCached", strip_punctuation=False) == "partial-one"
+        assert kebabify("PartialCached", strip_punctuation=False) == "partial-one"
+
+    kebab.assert_called_once_with("PartialCached", strip_punctuation=False)
+
+    _kebabify.cache_clear()
+
+
+def test_delimiters():
+    assert kebabify("hello-world", delimiters=" _") == "helloworld"
@@ -0,0 +1,96 @@
+import json
+from io import StringIO
+
+import pytest
+from django.core.management import CommandError, call_command
+
+from dj_angles.profiling import get_percentile, profile_template
+
+
+def test_angles_profile():
+    stdout = StringIO()
+
+    call_command("angles_profile", "--iterations", "2", stdout=stdout)
+
+    lines = stdout.getvalue().splitlines()
+
+    assert lines[0].split() == ["Template", "Mean", "(ms)", "P95", "(ms)", "Size", "Tags", "Comments", "Peak", "(KiB)"]
+    assert any(line.startswith("slot.html ") for line in lines)
+    assert lines[-1].endswith(" templates")
+
+
+def test_angles_profile_json():
+    stdout = StringIO()
+
+    call_command("angles_profile", "--iterations", "3", "--sort", "size", "--json", stdout=stdout)
+
+    profiles = json.loads(stdout.getvalue())
+    template_names = [profile["template_name"] for profile in profiles]
+
+    assert "slot.html" in template_names
+    assert "inline/static.html" in template_names
+
+    # Templates are only reported once
+    assert len(template_names) == len(set(template_names))
+
+    sizes = [profile["input_size"] for profile in profiles]
+    assert sizes == sorted(sizes, reverse=True)
+
+    slot = profiles[template_names.index("slot.html")]
+    assert slot["iterations"] == 3
+    assert slot["mean"] > 0
+    assert slot["p95"] > 0
+    assert slot["tag_count"] == 0
+    assert slot["comment_count"] == 0
+    assert slot["peak_memory"] > 0
+
+
+def test_angles_profile_limit():
+    stdout = StringIO()
+
+    call_command("angles_profile", "--iterations", "1", "--limit", "2", "--json", stdout=stdout)
+
+    assert len(json.loads(stdout.getvalue())) == 2
+
+
+def test_angles_profile_invalid_iterations():
+    with pytest.raises(CommandError) as e:
+        call_command("angles_profile", "--iterations", "0")
+
+    assert e.exconly() == "django.core.management.base.CommandError: --iterations must be at least 1"
+
+
+def test_angles_profile_without_loader(settings):
+    settings.TEMPLATES = [
+        {
+            "BACKEND": "django.template.backends.django.DjangoTemplates",
+            "DIRS": ["tests/templates"],
+        }
+    ]
+
+    with pytest.raises(CommandError) as e:
+        call_command("angles_profile")
+
+    assert e.exconly() == (
+        "django.core.management.base.CommandError: dj_angles.template_loader.Loader is not in the template loaders"
+    )
+
+
+def test_profile_template():
+    template = "{# comment #}<dj-block name='content'></dj-block>"
+
+    profile = profile_template(template, iterations=4)
+
+    assert profile.template_name == ""
+    assert len(profile.durations) == 4
+    assert profile.input_size == len(template)
+    assert profile.tag_count == 2
+    assert profile.comment_count == 1
+    assert profile.peak_memory > 0
+
+
+def test_get_percentile():
+    assert get_percentile([], 95) == 0.0
+    assert get_percentile([1.0], 95) == 1.0
+    assert get_percentile([float(i) for i in range(1, 101)], 95) == 95.0
+    assert get_percentile([3.0, 1.0, 2.0], 50) == 2.0
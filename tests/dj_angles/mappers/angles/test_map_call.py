@@ -27,3 +27,12 @@ def test_end_tag():
     actual = map_call(tag=tag)
 
     assert actual == expected
+
+
+def test_cache():
+    expected = '{% call slugify("Hello Goodbye") cache as slug %}'
+
+    tag = create_tag("<dj-call code='slugify(\"Hello Goodbye\")' as='slug' cache>")
+    actual = map_call(tag=tag)
+
+    assert actual == expected
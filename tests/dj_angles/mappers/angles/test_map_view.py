@@ -0,0 +1,20 @@
+from dj_angles.mappers.angles import map_view
+from tests.dj_angles.tags import create_tag
+
+
+def test_as():
+    expected = "{% view 'www:partial' as partial %}"
+
+    tag = create_tag("<dj-view name=\"'www:partial'\" as='partial'>")
+    actual = map_view(tag=tag)
+
+    assert actual == expected
+
+
+def test_cache():
+    expected = "{% view 'www:partial' cache=60 vary=request.user.id %}"
+
+    tag = create_tag("<dj-view name=\"'www:partial'\" cache=60 vary=request.user.id />")
+    actual = map_view(tag=tag)
+
+    assert actual == expected
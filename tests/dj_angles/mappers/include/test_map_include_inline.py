@@ -0,0 +1,218 @@
+import pytest
+from django.template import Context, Template
+from tests.dj_angles.tags import create_tag
+
+from dj_angles.exceptions import InvalidAttributeError
+from dj_angles.mappers.include import clear_static_contents, map_include, static_contents
+from dj_angles.replacers import convert_template
+
+
+@pytest.fixture(autouse=True)
+def clear_static():
+    clear_static_contents()
+
+    yield
+
+    clear_static_contents()
+
+
+def test_inline():
+    expected = "<dj-inline-static>{% with __dj_angles_inline=True %}<span>Static</span>{% endwith %}</dj-inline-static>"
+
+    html = "<dj-include 'inline/static' inline />"
+    tag = create_tag(html)
+
+    actual = map_include(tag=tag)
+
+    assert actual == expected
+
+
+def test_inline_with_variable():
+    expected = (
+        "<dj-inline-variable>{% with __dj_angles_inline=True %}<span>{{ name }}</span>{% endwith %}"
+        "</dj-inline-variable>"
+    )
+
+    html = "<dj-include 'inline/variable' inline />"
+    tag = create_tag(html)
+
+    actual = map_include(tag=tag)
+
+    assert actual == expected
+
+
+def test_inline_no_wrap():
+    expected = "{% with __dj_angles_inline=True %}<span>Static</span>{% endwith %}"
+
+    html = "<dj-include 'inline/static' inline no-wrap />"
+    tag = create_tag(html)
+
+    actual = map_include(tag=tag)
+
+    assert actual == expected
+
+
+def test_inline_extends_is_included():
+    expected = "<dj-inline-extends>{% include 'inline/extends.html' %}</dj-inline-extends>"
+
+    html = "<dj-include 'inline/extends' inline />"
+    tag = create_tag(html)
+
+    actual = map_include(tag=tag)
+
+    assert actual == expected
+
+
+def test_inline_with_attributes():
+    html = "<dj-include 'inline/static' inline with name='test' />"
+    tag = create_tag(html)
+
+    with pytest.raises(InvalidAttributeError) as e:
+        map_include(tag=tag)
+
+    assert e.exconly() == "dj_angles.exceptions.InvalidAttributeError: `inline` cannot be used with other attributes"
+
+
+def test_inline_missing_template():
+    html = "<dj-include 'inline/missing' inline />"
+    tag = create_tag(html)
+
+    with pytest.raises(InvalidAttributeError) as e:
+        map_include(tag=tag)
+
+    assert (
+        e.exconly()
+        == "dj_angles.exceptions.InvalidAttributeError: `inline` template could not be found: 'inline/missing.html'"
+    )
+
+
+def test_not_inline():
+    expected = "<dj-inline-static>{% include 'inline/static.html' %}</dj-inline-static>"
+
+    html = "<dj-include 'inline/static' />"
+    tag = create_tag(html)
+
+    actual = map_include(tag=tag)
+
+    assert actual == expected
+
+
+def test_inline_max_size(settings):
+    settings.ANGLES["includes"] = {"inline_max_size": 100}
+
+    expected = "<dj-inline-static>{% with __dj_angles_inline=True %}<span>Static</span>{% endwith %}</dj-inline-static>"
+
+    html = "<dj-include 'inline/static' />"
+    tag = create_tag(html)
+
+    actual = map_include(tag=tag)
+
+    assert actual == expected
+
+
+def test_inline_max_size_too_large(settings):
+    settings.ANGLES["includes"] = {"inline_max_size": 5}
+
+    expected = "<dj-inline-static>{% include 'inline/static.html' %}</dj-inline-static>"
+
+    html = "<dj-include 'inline/static' />"
+    tag = create_tag(html)
+
+    actual = map_include(tag=tag)
+
+    assert actual == expected
+
+
+def test_inline_max_size_with_attributes(settings):
+    settings.ANGLES["includes"] = {"inline_max_size": 100}
+
+    expected = "<dj-inline-variable>{% include 'inline/variable.html' with name='test' %}</dj-inline-variable>"
+
+    html = "<dj-include 'inline/variable' with name='test' />"
+    tag = create_tag(html)
+
+    actual = map_include(tag=tag)
+
+    assert actual == expected
+
+
+def test_inline_does_not_leak_context():
+    html = convert_template("<dj-include 'inline/title' inline no-wrap /><p>{{ title }}</p>")
+    template = Template(html)
+
+    actual = template.render(Context({"title": "Page", "get_title": lambda: "Component"}))
+
+    assert actual == "<h1>Component</h1>\n<p>Page</p>"
+
+
+def test_prerender_static(settings):
+    settings.ANGLES["includes"] = {"prerender_static": True}
+
+    expected = "<dj-inline-static><span>Static</span></dj-inline-static>"
+
+    html = "<dj-include 'inline/static' />"
+    tag = create_tag(html)
+
+    actual = map_include(tag=tag)
+
+    assert actual == expected
+
+
+def test_prerender_static_comment(settings):
+    settings.ANGLES["includes"] = {"prerender_static": True}
+
+    expected = "<dj-inline-comment><span>Commented</span></dj-inline-comment>"
+
+    html = "<dj-include 'inline/comment' />"
+    tag = create_tag(html)
+
+    actual = map_include(tag=tag)
+
+    assert actual == expected
+
+
+def test_prerender_static_variable(settings):
+    settings.ANGLES["includes"] = {"prerender_static": True}
+
+    expected = "<dj-inline-variable>{% include 'inline/variable.html' %}</dj-inline-variable>"
+
+    html = "<dj-include 'inline/variable' />"
+    tag = create_tag(html)
+
+    actual = map_include(tag=tag)
+
+    assert actual == expected
+
+
+def test_prerender_static_with_attributes(settings):
+    settings.ANGLES["includes"] = {"prerender_static": True}
+
+    expected = "<dj-inline-static>{% include 'inline/static.html' with name='test' %}</dj-inline-static>"
+
+    html = "<dj-include 'inline/static' with name='test' />"
+    tag = create_tag(html)
+
+    actual = map_include(tag=tag)
+
+    assert actual == expected
+
+
+def test_prerender_static_is_cached(settings):
+    settings.ANGLES["includes"] = {"prerender_static": True}
+
+    map_include(tag=create_tag("<dj-include 'inline/static' />"))
+    map_include(tag=create_tag("<dj-include 'inline/static' />"))
+    map_include(tag=create_tag("<dj-include 'inline/variable' />"))
+
+    assert list(static_contents.values()) == ["<span>Static</span>", None]
+
+
+def test_no_prerender_static():
+    expected = "<dj-inline-static>{% include 'inline/static.html' %}</dj-inline-static>"
+
+    html = "<dj-include 'inline/static' />"
+    tag = create_tag(html)
+
+    actual = map_include(tag=tag)
+
+    assert actual == expected
@@ -46,3 +46,55 @@ def test_django_old_version_disables_partial():
         with patch("dj_angles.mappers.mapper.is_module_available", return_value=False):
             tag_map = TagMap()
             assert "partial" not in tag_map
+
+
+def test_mappers_are_imported_when_used():
+    tag_map = get_tag_map()
+
+    assert tag_map.data["partial"] == "dj_angles.mappers.map_partial"
+
+    actual = tag_map["partial"]
+
+    assert callable(actual)
+    assert actual.__name__ == "map_partial"
+    assert tag_map.data["partial"] is actual
+
+
+def test_template_tag_names_are_not_imported():
+    tag_map = get_tag_map()
+
+    assert tag_map["verbatim"] == "verbatim"
+    assert tag_map.get("csrf") == "csrf_token"
+    assert tag_map.get("missing") is None
+
+
+def test_set_import_string():
+    tag_map = get_tag_map()
+    tag_map["verbatim"]
+
+    tag_map["verbatim"] = "dj_angles.mappers.map_include"
+
+    assert tag_map["verbatim"].__name__ == "map_include"
+
+
+def test_is_mapped():
+    tag_map = get_tag_map()
+
+    assert tag_map.is_mapped("include")
+    assert tag_map.is_mapped("Include")
+    assert not tag_map.is_mapped("missing")
+
+    assert tag_map.mapped_tag_names == {"include": True, "Include": True, "missing": False}
+
+
+def test_setting_changed(settings):
+    tag_map = get_tag_map()
+
+    assert get_tag_map() is tag_map
+
+    settings.ANGLES = {"mappers": {"hello": "dj_angles.mappers.map_include"}}
+
+    actual = get_tag_map()
+
+    assert actual is not tag_map
+    assert actual["hello"].__name__ == "map_include"
@@ -1,3 +1,5 @@
+from asgiref.sync import async_to_sync, iscoroutinefunction
+
 from dj_angles.middleware import RequestAJAXMiddleware
 
 
@@ -17,3 +19,23 @@ def test_ajax(rf):
     middleware.__call__(request)
 
     assert request.is_ajax
+
+
+def test_sync():
+    middleware = RequestAJAXMiddleware(lambda _: None)
+
+    assert not iscoroutinefunction(middleware)
+
+
+def test_async(rf):
+    async def get_response(request):
+        return request.is_ajax
+
+    middleware = RequestAJAXMiddleware(get_response)
+
+    assert iscoroutinefunction(middleware)
+
+    request = rf.get("/", HTTP_X_REQUESTED_WITH="XMLHttpRequest")
+    response = async_to_sync(middleware)(request)
+
+    assert response is True
@@ -1,4 +1,7 @@
-from dj_angles.middleware import RequestMethodMiddleware
+import pytest
+from asgiref.sync import async_to_sync, iscoroutinefunction
+
+from dj_angles.middleware import RequestMethodMiddleware, RequestMiddleware
 
 
 def test_get(rf):
@@ -104,3 +107,47 @@ def test_trace(rf):
     assert not request.is_put
     assert not request.is_delete
     assert request.is_trace
+
+
+def test_connect(rf):
+    middleware = RequestMethodMiddleware(lambda _: None)
+
+    request = rf.generic("CONNECT", "/")
+    middleware.__call__(request)
+
+    assert not request.is_get
+    assert request.is_connect
+
+
+def test_unknown_method(rf):
+    middleware = RequestMethodMiddleware(lambda _: None)
+
+    request = rf.generic("PROPFIND", "/")
+    middleware.__call__(request)
+
+    assert not request.is_get
+    assert not request.is_post
+    assert not request.is_connect
+
+
+def test_async(rf):
+    async def get_response(request):
+        return request.is_post
+
+    middleware = RequestMethodMiddleware(get_response)
+
+    assert iscoroutinefunction(middleware)
+
+    request = rf.post("/")
+    response = async_to_sync(middleware)(request)
+
+    assert response is True
+    assert not request.is_get
+
+
+def test_request_middleware_requires_process_request():
+    class IncompleteMiddleware(RequestMiddleware):
+        pass
+
+    with pytest.raises(TypeError):
+        IncompleteMiddleware(lambda _: None)
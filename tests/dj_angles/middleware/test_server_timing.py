@@ -0,0 +1,90 @@
+from asgiref.sync import async_to_sync, iscoroutinefunction
+from django.http import HttpResponse
+from django.template import Context, Template
+
+from dj_angles.middleware import ServerTimingMiddleware
+from dj_angles.timings import get_timings
+
+
+def get_name():
+    return "dj-angles"
+
+
+def render_call(request):
+    template = Template("{% call get_name() %}")
+
+    return HttpResponse(template.render(Context({"get_name": get_name, "request": request})))
+
+
+def test_server_timing(rf):
+    middleware = ServerTimingMiddleware(render_call)
+
+    response = middleware(rf.get("/"))
+
+    assert response.content == b"dj-angles"
+    assert response["Server-Timing"].startswith("angles-call;dur=")
+    assert response["Server-Timing"].endswith(';desc="call (1)"')
+
+
+def test_server_timing_existing_header(rf):
+    def get_response(request):
+        response = render_call(request)
+        response["Server-Timing"] = "db;dur=1.00"
+
+        return response
+
+    middleware = ServerTimingMiddleware(get_response)
+
+    response = middleware(rf.get("/"))
+
+    assert response["Server-Timing"].startswith("db;dur=1.00, angles-call;dur=")
+
+
+def test_server_timing_no_timings(rf):
+    middleware = ServerTimingMiddleware(lambda _: HttpResponse("test"))
+
+    response = middleware(rf.get("/"))
+
+    assert "Server-Timing" not in response
+
+
+def test_server_timing_is_only_collected_during_request(rf):
+    middleware = ServerTimingMiddleware(render_call)
+
+    middleware(rf.get("/"))
+
+    assert get_timings() is None
+
+
+def test_server_timing_slow_threshold(rf, settings, caplog):
+    settings.ANGLES["server_timing"] = {"slow_threshold": 0}
+
+    middleware = ServerTimingMiddleware(render_call)
+
+    with caplog.at_level("WARNING"):
+        middleware(rf.get("/test"))
+
+    assert "Slow call for get_name()" in caplog.text
+    assert "(/test)" in caplog.text
+
+
+def test_server_timing_no_slow_threshold(rf, caplog):
+    middleware = ServerTimingMiddleware(render_call)
+
+    with caplog.at_level("WARNING"):
+        middleware(rf.get("/"))
+
+    assert caplog.text == ""
+
+
+def test_server_timing_async(rf):
+    async def get_response(request):
+        return render_call(request)
+
+    middleware = ServerTimingMiddleware(get_response)
+
+    assert iscoroutinefunction(middleware)
+
+    response = async_to_sync(middleware)(rf.get("/"))
+
+    assert response["Server-Timing"].startswith("angles-call;dur=")
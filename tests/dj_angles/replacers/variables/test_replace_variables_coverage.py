@@ -1,4 +1,4 @@
-from dj_angles.replacers.variables import replace_variables
+from dj_angles.replacers.variables import get_replacement, process_value, replace_variables
 
 
 def test_empty_variable_block():
@@ -19,3 +19,35 @@ def test_or_at_start():
 def test_or_at_end():
     html = "{{ A or }}"
     assert replace_variables(html) == "{{ A or }}"  # Should not change
+
+
+def test_variable_without_or_or_if_is_not_tokenized():
+    get_replacement.cache_clear()
+
+    html = "{{ order.notify|default:'ifs' }}"
+    assert replace_variables(html) == html
+
+    assert get_replacement.cache_info().currsize == 0
+
+
+def test_or_inside_quotes():
+    html = "{{ 'this or that' }}"
+    assert replace_variables(html) == html
+
+
+def test_get_replacement_is_cached():
+    get_replacement.cache_clear()
+
+    html = "{{ var or 'default' }}{{  var or 'default'  }}"
+    expected = "{% if var %}{{ var }}{% else %}default{% endif %}" * 2
+    assert replace_variables(html) == expected
+
+    cache_info = get_replacement.cache_info()
+    assert cache_info.hits == 1
+    assert cache_info.misses == 1
+
+
+def test_process_value():
+    assert process_value("var") == "{{ var }}"
+    assert process_value("'default'") == "default"
+    assert process_value("'{{ default }}'") == "{% verbatim %}{{ default }}{% endverbatim %}"
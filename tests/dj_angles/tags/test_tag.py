@@ -1,6 +1,7 @@
 import pytest
 
 from dj_angles.exceptions import MissingAttributeError
+from dj_angles.tags import get_wrapping_tag_name
 from tests.dj_angles.tags import create_tag
 
 
@@ -98,3 +99,27 @@ def test_missing_attribute_error_from_pop_attribute():
     tag = create_tag(html="<dj-test>")
     with pytest.raises(MissingAttributeError):
         tag.pop_attribute_value_or_first_key("missing")
+
+
+@pytest.mark.parametrize(
+    "name,expected",
+    [
+        ("partial", "dj-partial"),
+        ("'partial.html'", "dj-partial"),
+        ('"components/partial.html"', "dj-components-partial"),
+        ("app:components//Partial.min.html", "dj-app-components-partial"),
+        ("partial!", "dj-partial"),
+        ("a - b", "dj-a-b"),
+    ],
+)
+def test_get_wrapping_tag_name_function(name, expected):
+    assert get_wrapping_tag_name(name) == expected
+
+
+def test_get_wrapping_tag_name_is_cached():
+    get_wrapping_tag_name.cache_clear()
+
+    get_wrapping_tag_name("'partial.html'")
+    get_wrapping_tag_name("'partial.html'")
+
+    assert get_wrapping_tag_name.cache_info().hits == 1
@@ -86,3 +86,57 @@ def test_template_variable():
     assert portion.args[1] == 8
     assert portion.kwargs == {}
     assert actual.context_variable_name == "name"
+
+
+def test_cache():
+    token = Token(TokenType.BLOCK, contents="call set_name cache as name")
+    actual = do_call(None, token)
+
+    assert actual.cache is True
+    assert actual.context_variable_name == "name"
+
+
+def test_no_cache():
+    token = Token(TokenType.BLOCK, contents="call set_name as name")
+    actual = do_call(None, token)
+
+    assert actual.cache is False
+
+
+def test_invalid_option():
+    token = Token(TokenType.BLOCK, contents="call set_name blob as name")
+
+    with pytest.raises(TemplateSyntaxError) as e:
+        do_call(None, token)
+
+    assert e.exconly() == "django.template.exceptions.TemplateSyntaxError: Invalid call argument: blob"
+
+
+def test_stream():
+    token = Token(TokenType.BLOCK, contents="call get_books stream as books")
+    actual = do_call(None, token)
+
+    assert actual.chunk_size == 2000
+
+
+def test_chunk_size():
+    token = Token(TokenType.BLOCK, contents="call get_books chunk_size=100 as books")
+    actual = do_call(None, token)
+
+    assert actual.chunk_size == 100
+
+
+def test_no_stream():
+    token = Token(TokenType.BLOCK, contents="call get_books as books")
+    actual = do_call(None, token)
+
+    assert actual.chunk_size is None
+
+
+def test_invalid_chunk_size():
+    token = Token(TokenType.BLOCK, contents="call get_books chunk_size=0 as books")
+
+    with pytest.raises(TemplateSyntaxError) as e:
+        do_call(None, token)
+
+    assert e.exconly() == "django.template.exceptions.TemplateSyntaxError: Invalid chunk_size: 0"
@@ -1,5 +1,8 @@
+from dataclasses import dataclass
+
 import pytest
 from django.contrib.auth.models import User
+from django.template import Context, Template
 from django.template.base import Token, TokenType, VariableDoesNotExist
 from django.template.context import RenderContext
 from example.book.models import Book
@@ -498,3 +501,95 @@ def test_missing_template_variable():
 
     with pytest.raises(VariableDoesNotExist):
         node.render(context)
+
+
+def test_cache(rf):
+    counter = {"count": 0}
+
+    def get_count(name):
+        counter["count"] += 1
+        return f"{name}-{counter['count']}"
+
+    template = Template(
+        "{% call get_count('a') cache as first %}{% call get_count('a') cache as second %}{{ first }} {{ second }}"
+    )
+    rendered = template.render(Context({"get_count": get_count, "request": rf.get("/")}))
+
+    assert rendered == "a-1 a-1"
+    assert counter["count"] == 1
+
+
+def test_cache_different_args():
+    counter = {"count": 0}
+
+    def get_count(name):
+        counter["count"] += 1
+        return f"{name}-{counter['count']}"
+
+    template = Template(
+        "{% call get_count('a') cache %} {% call get_count('b') cache %} {% call get_count('a') cache %}"
+    )
+    rendered = template.render(Context({"get_count": get_count}))
+
+    assert rendered == "a-1 b-2 a-1"
+
+
+def test_cache_different_objects():
+    class Person:
+        def __init__(self, name):
+            self.name = name
+
+        def get_name(self):
+            return self.name
+
+    template = Template("{% for person in people %}{% call person.get_name() cache %}{% endfor %}")
+    rendered = template.render(Context({"people": [Person("Alice"), Person("Bob")]}))
+
+    assert rendered == "AliceBob"
+
+
+def test_cache_is_per_request(rf):
+    counter = {"count": 0}
+
+    def get_count():
+        counter["count"] += 1
+        return counter["count"]
+
+    template = Template("{% call get_count() cache %}")
+
+    assert template.render(Context({"get_count": get_count, "request": rf.get("/")})) == "1"
+    assert template.render(Context({"get_count": get_count, "request": rf.get("/")})) == "2"
+
+
+def test_no_cache():
+    counter = {"count": 0}
+
+    def get_count():
+        counter["count"] += 1
+        return counter["count"]
+
+    template = Template("{% call get_count() %} {% call get_count() %}")
+    rendered = template.render(Context({"get_count": get_count}))
+
+    assert rendered == "1 2"
+
+
+def test_cache_unhashable_objects_are_not_reused():
+    @dataclass
+    class Item:
+        name: str
+
+        def label(self):
+            return self.name
+
+    def get_item(name):
+        # A new unhashable object every time, so it can be garbage-collected after each iteration
+        return Item(name)
+
+    template = Template(
+        "{% for n in names %}{% with x=1 %}{% call get_item(n) as item %}{% call item.label() cache %}"
+        "{% endwith %},{% endfor %}"
+    )
+    rendered = template.render(Context({"get_item": get_item, "names": list("abcdef")}))
+
+    assert rendered == "a,b,c,d,e,f,"
@@ -1,4 +1,7 @@
+import pytest
+from django.template import TemplateSyntaxError
 from django.template.base import Token, TokenType
+from example.book.models import Book
 
 from dj_angles.templatetags.model import do_model
 
@@ -7,11 +10,55 @@ def test_model():
     token = Token(TokenType.BLOCK, contents="model Book.objects.filter(id=1).first() as books")
     actual = do_model(None, token)
 
-    assert actual.parsed_function.portions[0].name == "__dj_angles_models"
-    assert actual.parsed_function.portions[1].name == "Book"
-    assert actual.parsed_function.portions[2].name == "objects"
-    assert actual.parsed_function.portions[3].name == "filter"
-    assert actual.parsed_function.portions[3].args == []
-    assert actual.parsed_function.portions[3].kwargs == {"id": 1}
-    assert actual.parsed_function.portions[4].name == "first"
+    assert actual.model is Book
+    assert actual.parsed_function.portions[0].name == "Book"
+    assert actual.parsed_function.portions[1].name == "objects"
+    assert actual.parsed_function.portions[2].name == "filter"
+    assert actual.parsed_function.portions[2].args == []
+    assert actual.parsed_function.portions[2].kwargs == {"id": 1}
+    assert actual.parsed_function.portions[3].name == "first"
     assert actual.context_variable_name == "books"
+
+
+def test_model_app_label():
+    token = Token(TokenType.BLOCK, contents="model book.Book.objects.all()")
+    actual = do_model(None, token)
+
+    assert actual.model is Book
+    assert actual.parsed_function.portions[0].name == "Book"
+    assert actual.parsed_function.portions[1].name == "objects"
+
+
+def test_invalid_model():
+    token = Token(TokenType.BLOCK, contents="model Missing.objects.all()")
+
+    with pytest.raises(TemplateSyntaxError) as e:
+        do_model(None, token)
+
+    assert e.exconly() == "django.template.exceptions.TemplateSyntaxError: Invalid model: Missing"
+
+
+def test_invalid_app_label_model():
+    token = Token(TokenType.BLOCK, contents="model book.Missing.objects.all()")
+
+    with pytest.raises(TemplateSyntaxError) as e:
+        do_model(None, token)
+
+    assert e.exconly() == "django.template.exceptions.TemplateSyntaxError: Invalid model: Missing"
+
+
+def test_model_related_and_prefetch():
+    token = Token(TokenType.BLOCK, contents="model Book.objects.all() related='publisher' prefetch=['authors','tags']")
+    actual = do_model(None, token)
+
+    assert actual.related == ("publisher",)
+    assert actual.prefetch == ("authors", "tags")
+
+
+def test_invalid_option():
+    token = Token(TokenType.BLOCK, contents="model Book.objects.all() missing")
+
+    with pytest.raises(TemplateSyntaxError) as e:
+        do_model(None, token)
+
+    assert e.exconly() == "django.template.exceptions.TemplateSyntaxError: Invalid model argument: missing"
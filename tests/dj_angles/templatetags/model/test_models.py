@@ -0,0 +1,44 @@
+from django.apps import apps
+from django.db import models as db_models
+from example.book.models import Book
+
+from dj_angles import model_registry
+from dj_angles.apps import Config
+from dj_angles.model_registry import get_model_registry
+
+
+def test_models_are_loaded_when_ready():
+    assert model_registry.models is None
+
+    app_config = apps.get_app_config("dj_angles")
+    assert isinstance(app_config, Config)
+
+    app_config.ready()
+
+    assert model_registry.models is not None
+    assert model_registry.models["Book"] is Book
+    assert model_registry.models["book"]["Book"] is Book
+
+
+def test_get_model_registry_loads_models():
+    assert model_registry.models is None
+
+    registry = get_model_registry()
+
+    assert registry["Book"] is Book
+    assert model_registry.models is registry
+
+
+def test_class_prepared_registers_model():
+    registry = get_model_registry()
+
+    class Magazine(db_models.Model):
+        class Meta:
+            app_label = "book"
+
+    try:
+        assert registry["Magazine"] is Magazine
+        assert registry["book"]["Magazine"] is Magazine
+    finally:
+        del apps.all_models["book"]["magazine"]
+        apps.clear_cache()
@@ -2,7 +2,7 @@ from unittest.mock import patch
 
 import pytest
 
-from dj_angles.templatetags.model import get_models
+from dj_angles.model_registry import get_models
 
 
 # Mock setup for apps and models
@@ -25,7 +25,7 @@ class MockAppConfig:
 
 @pytest.fixture
 def mock_apps():
-    with patch("dj_angles.templatetags.model.apps") as mock_apps:
+    with patch("dj_angles.model_registry.apps") as mock_apps:
         yield mock_apps
 
 
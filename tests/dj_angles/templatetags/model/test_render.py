@@ -1,10 +1,12 @@
 from unittest.mock import patch
 
 import pytest
+from django.template import Context, Template
 from django.template.base import Token, TokenType
 from django.template.context import RenderContext
-from example.book.models import Book
+from example.book.models import Author, Book
 
+from dj_angles.templatetags.call import DEFAULT_CHUNK_SIZE, QuerySetStream
 from dj_angles.templatetags.model import do_model
 
 
@@ -24,20 +26,152 @@ def test_model():
 
 
 @pytest.mark.django_db
-@patch("dj_angles.templatetags.model.get_models")
-def test_model_verify_models_are_cached(get_models):
+def test_model_does_not_change_context():
+    Book.objects.create(id=1, title="Tom Sawyer")
+
+    token = Token(TokenType.BLOCK, contents="model Book.objects.filter(id=1).first().title")
+    node = do_model(None, token)
+
+    context = Context()
+
+    assert node.render(context) == "Tom Sawyer"
+    assert context.flatten() == Context().flatten()
+
+
+@pytest.mark.django_db
+def test_model_verify_models_are_not_loaded_when_rendering():
     Book.objects.create(id=1, title="Tom Sawyer")
 
     token = Token(TokenType.BLOCK, contents="model Book.objects.filter(id=1).first() as book")
     node = do_model(None, token)
 
-    context = RenderContext({"Book": Book})
+    with patch("dj_angles.model_registry.get_models") as get_models:
+        node.render(RenderContext())
+        node.render(RenderContext())
 
     assert get_models.call_count == 0
 
+
+@pytest.mark.django_db
+def test_model_cache(rf, django_assert_num_queries):
+    Book.objects.create(id=1, title="Tom Sawyer")
+
+    template = Template(
+        "{% model Book.objects.count() cache as first %}{% model Book.objects.count() cache as second %}"
+        "{{ first }} {{ second }}"
+    )
+
+    with django_assert_num_queries(1):
+        rendered = template.render(Context({"request": rf.get("/")}))
+
+    assert rendered == "1 1"
+
+
+@pytest.mark.django_db
+def test_model_no_cache(django_assert_num_queries):
+    Book.objects.create(id=1, title="Tom Sawyer")
+
+    template = Template("{% model Book.objects.count() %} {% model Book.objects.count() %}")
+
+    with django_assert_num_queries(2):
+        rendered = template.render(Context())
+
+    assert rendered == "1 1"
+
+
+@pytest.fixture
+def authors():
+    first = Book.objects.create(title="Tom Sawyer")
+    second = Book.objects.create(title="Huckleberry Finn")
+
+    for name in ("Mark Twain", "Samuel Clemens"):
+        author = Author.objects.create(name=name)
+        author.books.add(first, second)
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("authors")
+def test_model_prefetch(django_assert_num_queries):
+    template = Template(
+        "{% model Author.objects.order_by('id') prefetch='books' as authors %}"
+        "{% for author in authors %}{{ author.name }}: {{ author.books.all|length }} {% endfor %}"
+    )
+
+    with django_assert_num_queries(2):
+        rendered = template.render(Context())
+
+    assert rendered == "Mark Twain: 2 Samuel Clemens: 2 "
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("authors")
+def test_model_no_prefetch(django_assert_num_queries):
+    template = Template(
+        "{% model Author.objects.order_by('id') as authors %}"
+        "{% for author in authors %}{{ author.name }}: {{ author.books.all|length }} {% endfor %}"
+    )
+
+    with django_assert_num_queries(3):
+        rendered = template.render(Context())
+
+    assert rendered == "Mark Twain: 2 Samuel Clemens: 2 "
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("authors")
+def test_model_prefetch_non_queryset_method(django_assert_num_queries):
+    template = Template(
+        "{% model Author.objects.first() prefetch=['books'] as author %}"
+        "{{ author.name }}: {{ author.books.all|length }}"
+    )
+
+    with django_assert_num_queries(2):
+        rendered = template.render(Context())
+
+    assert rendered == "Mark Twain: 2"
+
+
+def test_model_related():
+    token = Token(TokenType.BLOCK, contents="model Book.objects.all() related='publisher' as books")
+    node = do_model(None, token)
+
+    context = RenderContext()
     node.render(context)
 
-    get_models.assert_called_once()
+    assert context["books"].query.select_related == {"publisher": {}}
+
 
+@pytest.mark.django_db
+def test_model_stream(django_assert_num_queries):
+    Book.objects.create(id=1, title="Tom Sawyer")
+    Book.objects.create(id=2, title="Huckleberry Finn")
+
+    template = Template(
+        "{% model Book.objects.order_by('id') chunk_size=1 as books %}"
+        "{% for book in books %}{{ forloop.revcounter }} {{ book.title }} {% endfor %}"
+    )
+    context = Context()
+
+    # One query to count the books and one to iterate over them
+    with django_assert_num_queries(2):
+        rendered = template.render(context)
+
+    assert rendered == "2 Tom Sawyer 1 Huckleberry Finn "
+
+
+@pytest.mark.django_db
+def test_model_stream_does_not_load_queryset():
+    Book.objects.create(id=1, title="Tom Sawyer")
+
+    token = Token(TokenType.BLOCK, contents="model Book.objects.all() stream as books")
+    node = do_model(None, token)
+
+    context = RenderContext()
     node.render(context)
-    get_models.assert_called_once()
+
+    books = context["books"]
+
+    assert isinstance(books, QuerySetStream)
+    assert books.chunk_size == DEFAULT_CHUNK_SIZE
+    assert [book.title for book in books] == ["Tom Sawyer"]
+    assert books.queryset._result_cache is None
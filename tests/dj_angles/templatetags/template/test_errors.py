@@ -15,3 +15,10 @@ def test_template_invalid_renderer():
     with pytest.raises(TemplateSyntaxError, match="Invalid template renderer"):
         t = Template(template_string)
         t.render(Context({}))
+
+
+def test_template_invalid_renderer_is_raised_when_compiled():
+    template_string = "{% load dj_angles %}{% template foo.bar %}{% endtemplate %}"
+
+    with pytest.raises(TemplateSyntaxError, match="Invalid template renderer"):
+        Template(template_string)
@@ -1,7 +1,11 @@
+from unittest.mock import patch
+
 import pytest
 from django.template import Context, Template
 from django.template.exceptions import TemplateSyntaxError
 
+from dj_angles.templatetags.template import TemplateNode
+
 
 def test_template_tag():
     template = Template("""
@@ -104,6 +108,32 @@ this is a template -> {{ name }}
     assert "this is a template -> test2" in rendered
 
 
+def test_template_tag_binding_plan():
+    template = Template("""
+{% template partial(first, second, name='test1', other=test2) %}{% endtemplate %}
+""")
+
+    renderer = template.nodelist.get_nodes_by_type(TemplateNode)[0].renderer
+
+    assert renderer.arg_names == ("first", "second")
+    assert renderer.defaults == {"name": "test1"}
+    assert list(renderer.variable_defaults) == ["other"]
+
+
+def test_template_tag_renderer_is_reused():
+    template = Template("""
+{% template partial() %}{% endtemplate %}
+""")
+
+    first_context = Context({})
+    template.render(first_context)
+
+    second_context = Context({})
+    template.render(second_context)
+
+    assert first_context["partial"] is second_context["partial"]
+
+
 def test_template_tag_kwarg_override():
     template = Template("""
 {% template partial(name=test1) %}
@@ -149,6 +179,36 @@ this is a template -> {{ name }}
     assert "this is a template -> test1" in rendered
 
 
+def test_template_tag_template_with_context_does_not_change_context():
+    template = Template("""
+{% template partial(name) with context %}
+{% call name.upper() as upper_name %}{{ upper_name }} {{ other }}
+{% endtemplate %}
+
+{% call partial('inner') %} {{ name }} {{ upper_name }}
+""")
+
+    context = Context({"name": "outer", "other": "shared"})
+    rendered = template.render(context)
+
+    assert rendered.split() == ["INNER", "shared", "outer"]
+    assert context["name"] == "outer"
+    assert "upper_name" not in context
+
+
+@patch.object(Context, "flatten")
+def test_template_tag_template_with_context_does_not_flatten_context(flatten):
+    template = Template("""
+{% template partial() with context %}{{ name }}{% endtemplate %}
+{% for name in names %}{% call partial() %}{% endfor %}
+""")
+
+    rendered = template.render(Context({"names": ["a", "b", "c"]}))
+
+    assert rendered.strip() == "abc"
+    assert flatten.call_count == 0
+
+
 def test_template_tag_template_without_context():
     template = Template("""
 {% template partial() %}
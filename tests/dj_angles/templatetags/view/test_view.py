@@ -1,8 +1,24 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from unittest.mock import patch
+
 import pytest
+from asgiref.sync import async_to_sync
+from django.core.cache import cache
 from django.http import HttpResponse
-from django.template import Context, Template
+from django.template import Context, Template, TemplateSyntaxError
 from django.test import override_settings
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.module_loading import import_string
 from django.views import View
+from example.book.models import Book
+
+from dj_angles.templates import arender_to_string
+from dj_angles.templatetags.view import get_cache_key_value, get_executor, get_startable_view_nodes, prefetch_views
+from dj_angles.timings import collect_timings
 
 
 def simple_view(request):
@@ -17,6 +33,61 @@ def view_with_kwargs(request, arg1=None):
     return HttpResponse(f"Kwarg: {arg1}")
 
 
+def counter_view(request, arg1=None):
+    request.view_calls = getattr(request, "view_calls", 0) + 1
+    return HttpResponse(f"Count: {request.view_calls} {arg1}")
+
+
+def not_found_view(request):
+    request.view_calls = getattr(request, "view_calls", 0) + 1
+    return HttpResponse("Not Found", status=404)
+
+
+def barrier_view(request, name):
+    # Only continues if another view is waiting on the barrier at the same time
+    request.barrier.wait()
+    return HttpResponse(f"{name}:{threading.current_thread().name}")
+
+
+def thread_view(request):
+    return HttpResponse(threading.current_thread().name)
+
+
+def nested_view(request):
+    template = Template("{% load dj_angles %}{% view 'tests.dj_angles.templatetags.view.test_view.thread_view' %}")
+
+    return HttpResponse(f"{threading.current_thread().name} {template.render(Context({'request': request}))}")
+
+
+def timings_view(request):
+    template = Template("{% load dj_angles %}{% call get_name() %}")
+    context = Context({"get_name": lambda: threading.current_thread().name})
+
+    return HttpResponse(template.render(context))
+
+
+def timezone_view(request):
+    return HttpResponse(f"{threading.current_thread().name} {timezone.get_current_timezone_name()}")
+
+
+async def async_view(request, arg1=None):
+    return HttpResponse(f"Async View: {arg1}")
+
+
+async def async_counter_view(request):
+    request.view_calls = getattr(request, "view_calls", 0) + 1
+    return HttpResponse(f"Async Count: {request.view_calls}")
+
+
+async def async_event_view(request, name, other):
+    # Only continues if the other view is running on the event loop at the same time
+    events = request.events
+    events[name].set()
+    await asyncio.wait_for(events[other].wait(), timeout=5)
+
+    return HttpResponse(f"{name}:{threading.current_thread().name}")
+
+
 class ClassView(View):
     def get(self, request):  # noqa: ARG002
         return HttpResponse("Class View")
@@ -33,6 +104,15 @@ def context(rf):
     return Context({"request": request})
 
 
+@pytest.fixture
+def clear_cache():
+    cache.clear()
+
+    yield
+
+    cache.clear()
+
+
 def test_tag_fbv(context):
     template = Template("{% load dj_angles %} {% view 'tests.dj_angles.templatetags.view.test_view.simple_view' %}")
     rendered = template.render(context)
@@ -91,6 +171,49 @@ def test_named_view_arg(context):
     assert "Named View Arg: FoundIt" in rendered
 
 
+@override_settings(ROOT_URLCONF="tests.dj_angles.templatetags.view.test_urls")
+@pytest.mark.urls("tests.dj_angles.templatetags.view.test_urls")
+def test_named_view_is_resolved_once(context):
+    template = Template("{% load dj_angles %}{% view 'named_view_args' 'FoundIt' %}")
+
+    with patch("dj_angles.templatetags.view.reverse", wraps=reverse) as mock_reverse:
+        assert template.render(context) == "Named View Arg: FoundIt"
+        assert template.render(context) == "Named View Arg: FoundIt"
+
+    assert mock_reverse.call_count == 1
+
+
+@override_settings(ROOT_URLCONF="tests.dj_angles.templatetags.view.test_urls")
+@pytest.mark.urls("tests.dj_angles.templatetags.view.test_urls")
+def test_named_view_template_variable_is_resolved_per_render(context):
+    template = Template("{% load dj_angles %}{% view 'named_view_args' arg %}")
+
+    with patch("dj_angles.templatetags.view.reverse", wraps=reverse) as mock_reverse:
+        context["arg"] = "First"
+        assert template.render(context) == "Named View Arg: First"
+
+        context["arg"] = "Second"
+        assert template.render(context) == "Named View Arg: Second"
+
+    assert mock_reverse.call_count == 2
+
+
+def test_imported_view_is_imported_once(context):
+    template = Template("{% load dj_angles %}{% view 'tests.dj_angles.templatetags.view.test_view.ClassView' %}")
+
+    with patch("dj_angles.templatetags.view.import_string", wraps=import_string) as mock_import_string:
+        assert template.render(context) == "Class View"
+
+        view_func = template.nodelist[-1].imported_view
+
+        assert template.render(context) == "Class View"
+
+    assert mock_import_string.call_count == 1
+
+    # `as_view` only gets called once
+    assert template.nodelist[-1].imported_view is view_func
+
+
 def test_tag_fbv_kwargs_parentheses(context):
     template = Template(
         "{% load dj_angles %} {% view tests.dj_angles.templatetags.view.test_view.view_with_kwargs(arg1='Testing') %}"
@@ -114,3 +237,342 @@ def test_tag_fbv_kwargs_template_variable(context):
     )
     rendered = template.render(context)
     assert "Kwarg: FromContext" in rendered
+
+
+@pytest.mark.usefixtures("clear_cache")
+def test_cache(context):
+    template = Template(
+        "{% load dj_angles %}{% view 'tests.dj_angles.templatetags.view.test_view.counter_view' cache=60 %}"
+    )
+
+    assert template.render(context) == "Count: 1 None"
+    assert template.render(context) == "Count: 1 None"
+    assert context["request"].view_calls == 1
+
+
+@pytest.mark.usefixtures("clear_cache")
+def test_cache_default_timeout(context):
+    template = Template(
+        "{% load dj_angles %}{% view 'tests.dj_angles.templatetags.view.test_view.counter_view' cache %}"
+    )
+
+    assert template.render(context) == "Count: 1 None"
+    assert template.render(context) == "Count: 1 None"
+
+
+@pytest.mark.usefixtures("clear_cache")
+def test_cache_different_kwargs(context):
+    template = Template(
+        "{% load dj_angles %}{% view 'tests.dj_angles.templatetags.view.test_view.counter_view' arg1=val cache=60 %}"
+    )
+
+    context["val"] = "a"
+    assert template.render(context) == "Count: 1 a"
+
+    context["val"] = "b"
+    assert template.render(context) == "Count: 2 b"
+
+    context["val"] = "a"
+    assert template.render(context) == "Count: 1 a"
+
+
+@pytest.mark.usefixtures("clear_cache")
+def test_cache_vary(context):
+    template = Template(
+        "{% load dj_angles %}"
+        "{% view 'tests.dj_angles.templatetags.view.test_view.counter_view' cache=60 vary=user.id %}"
+    )
+
+    context["user"] = SimpleNamespace(id=1)
+    assert template.render(context) == "Count: 1 None"
+    assert template.render(context) == "Count: 1 None"
+
+    context["user"] = SimpleNamespace(id=2)
+    assert template.render(context) == "Count: 2 None"
+
+
+@pytest.mark.usefixtures("clear_cache")
+def test_cache_vary_list(context):
+    template = Template(
+        "{% load dj_angles %}"
+        "{% view 'tests.dj_angles.templatetags.view.test_view.counter_view' cache=60 vary=[first,second] %}"
+    )
+
+    context.update({"first": 1, "second": 2})
+    assert template.render(context) == "Count: 1 None"
+
+    context.update({"first": 1, "second": 3})
+    assert template.render(context) == "Count: 2 None"
+
+
+@pytest.mark.usefixtures("clear_cache")
+def test_cache_vary_model_instances_with_same_str(context):
+    template = Template(
+        "{% load dj_angles %}{% view 'tests.dj_angles.templatetags.view.test_view.counter_view' cache=60 vary=book %}"
+    )
+
+    context["book"] = Book(pk=1, title="Same")
+    assert template.render(context) == "Count: 1 None"
+
+    context["book"] = Book(pk=2, title="Same")
+    assert template.render(context) == "Count: 2 None"
+
+    context["book"] = Book(pk=1, title="Same")
+    assert template.render(context) == "Count: 1 None"
+
+
+@pytest.mark.usefixtures("clear_cache")
+def test_cache_unstable_value_is_not_cached(context):
+    template = Template(
+        "{% load dj_angles %}{% view 'tests.dj_angles.templatetags.view.test_view.counter_view' arg1=obj cache=60 %}"
+    )
+
+    context["obj"] = SimpleNamespace(id=1)
+    template.render(context)
+    template.render(context)
+
+    assert context["request"].view_calls == 2
+
+
+def test_get_cache_key_value():
+    assert get_cache_key_value(("path", [1, "a"], {"b": None})) == ("path", (1, "a"), (("b", None),))
+    assert get_cache_key_value(Book(pk=1, title="Same")) == ("book.book", 1)
+
+
+def test_get_cache_key_value_unsaved_model():
+    with pytest.raises(TypeError) as e:
+        get_cache_key_value(Book(title="Same"))
+
+    assert e.exconly() == "TypeError: Unsaved book.Book cannot be used in a view cache key"
+
+
+@pytest.mark.usefixtures("clear_cache")
+def test_cache_error_response_is_not_cached(context):
+    template = Template(
+        "{% load dj_angles %}{% view 'tests.dj_angles.templatetags.view.test_view.not_found_view' cache=60 %}"
+    )
+
+    template.render(context)
+    template.render(context)
+
+    assert context["request"].view_calls == 2
+
+
+def test_vary_without_cache():
+    with pytest.raises(TemplateSyntaxError) as e:
+        Template("{% load dj_angles %}{% view 'tests.dj_angles.templatetags.view.test_view.counter_view' vary=a %}")
+
+    assert e.exconly() == (
+        "django.template.exceptions.TemplateSyntaxError: view template tag requires 'cache' to use 'vary'"
+    )
+
+
+def test_concurrent(settings, context):
+    settings.ANGLES["views"] = {"concurrent": True}
+    context["request"].barrier = threading.Barrier(2, timeout=5)
+
+    template = Template(
+        "{% load dj_angles %}"
+        "{% view 'tests.dj_angles.templatetags.view.test_view.barrier_view' 'first' %} "
+        "{% view 'tests.dj_angles.templatetags.view.test_view.barrier_view' 'second' %}"
+    )
+    rendered = template.render(context)
+
+    (first, second) = rendered.split(" ")
+
+    assert first.startswith("first:dj_angles_view")
+    assert second.startswith("second:dj_angles_view")
+
+
+def test_concurrent_template_variable_is_not_concurrent(settings, context):
+    settings.ANGLES["views"] = {"concurrent": True}
+    context["arg"] = "first"
+
+    template = Template(
+        "{% load dj_angles %}"
+        "{% view 'tests.dj_angles.templatetags.view.test_view.thread_view' %} "
+        "{% view 'tests.dj_angles.templatetags.view.test_view.view_with_kwargs' arg1=arg %}"
+    )
+    rendered = template.render(context)
+
+    (first, second) = rendered.split(" ", 1)
+
+    assert first.startswith("dj_angles_view")
+    assert second == "Kwarg: first"
+
+
+def test_concurrent_conditional_is_not_started(settings, context):
+    settings.ANGLES["views"] = {"concurrent": True}
+
+    template = Template(
+        "{% load dj_angles %}"
+        "{% view 'tests.dj_angles.templatetags.view.test_view.thread_view' %}"
+        "{% if show %}{% view 'tests.dj_angles.templatetags.view.test_view.counter_view' %}{% endif %}"
+    )
+    rendered = template.render(context)
+
+    assert rendered.startswith("dj_angles_view")
+    assert not hasattr(context["request"], "view_calls")
+
+
+@pytest.mark.usefixtures("clear_cache")
+def test_concurrent_cached_fragment_is_not_started(settings, context):
+    settings.ANGLES["views"] = {"concurrent": True}
+
+    template = Template(
+        "{% load dj_angles cache %}"
+        "{% view 'tests.dj_angles.templatetags.view.test_view.thread_view' %}"
+        "{% cache 500 fragment %}{% view 'tests.dj_angles.templatetags.view.test_view.counter_view' %}{% endcache %}"
+    )
+
+    template.render(context)
+    assert context["request"].view_calls == 1
+
+    # The fragment is cached, so the view inside of it is not called again
+    template.render(Context({"request": context["request"]}))
+    assert context["request"].view_calls == 1
+
+
+def test_get_startable_view_nodes():
+    template = Template(
+        "{% load dj_angles %}"
+        "{% with a=1 %}{% view 'tests.dj_angles.templatetags.view.test_view.simple_view' %}{% endwith %}"
+        "{% load cache %}{% cache 500 fragment %}"
+        "{% view 'tests.dj_angles.templatetags.view.test_view.simple_view' %}{% endcache %}"
+        "{% view 'tests.dj_angles.templatetags.view.test_view.view_with_kwargs' arg1=arg %}"
+        "{% if a %}{% view 'tests.dj_angles.templatetags.view.test_view.simple_view' %}{% endif %}"
+        "{% ifchanged %}{% view 'tests.dj_angles.templatetags.view.test_view.simple_view' %}{% endifchanged %}"
+        "{% for i in items %}{% view 'tests.dj_angles.templatetags.view.test_view.simple_view' %}{% endfor %}"
+        "{% template item() %}{% view 'tests.dj_angles.templatetags.view.test_view.simple_view' %}{% endtemplate %}"
+    )
+
+    (node,) = get_startable_view_nodes(template.nodelist)
+
+    assert node.parsed_function.portions[0].name.endswith("simple_view'")
+
+
+def test_concurrent_timezone(settings, context):
+    settings.ANGLES["views"] = {"concurrent": True}
+
+    template = Template("{% load dj_angles %}{% view 'tests.dj_angles.templatetags.view.test_view.timezone_view' %}")
+
+    with timezone.override("Asia/Tokyo"):
+        rendered = template.render(context)
+
+    (thread_name, timezone_name) = rendered.split(" ")
+
+    assert thread_name.startswith("dj_angles_view")
+    assert timezone_name == "Asia/Tokyo"
+
+
+def test_concurrent_timings(settings, context):
+    settings.ANGLES["views"] = {"concurrent": True}
+
+    template = Template("{% load dj_angles %}{% view 'tests.dj_angles.templatetags.view.test_view.timings_view' %}")
+
+    with collect_timings() as timings:
+        rendered = template.render(context)
+
+    assert rendered.startswith("dj_angles_view")
+    assert ("call", "get_name()") in [(name, label) for (name, label, _) in timings.events]
+
+
+def test_concurrent_nested_view(settings, context, monkeypatch):
+    settings.ANGLES["views"] = {"concurrent": True, "max_workers": 1}
+    monkeypatch.setattr("dj_angles.templatetags.view.executor", None)
+
+    template = Template("{% load dj_angles %}{% view 'tests.dj_angles.templatetags.view.test_view.nested_view' %}")
+
+    # Render in another thread so a deadlock fails the test instead of hanging it
+    test_executor = ThreadPoolExecutor(max_workers=1)
+
+    try:
+        rendered = test_executor.submit(template.render, context).result(timeout=5)
+    finally:
+        test_executor.shutdown(wait=False)
+        get_executor().shutdown(wait=False, cancel_futures=True)
+
+    (outer_thread_name, inner_thread_name) = rendered.split(" ")
+
+    # The nested view is rendered in the same worker thread
+    assert outer_thread_name.startswith("dj_angles_view")
+    assert inner_thread_name == outer_thread_name
+
+
+def test_not_concurrent(context):
+    template = Template("{% load dj_angles %}{% view 'tests.dj_angles.templatetags.view.test_view.thread_view' %}")
+    rendered = template.render(context)
+
+    assert rendered == threading.current_thread().name
+
+
+def test_async_view(context):
+    template = Template(
+        "{% load dj_angles %}{% view 'tests.dj_angles.templatetags.view.test_view.async_view' arg1='Testing' %}"
+    )
+    rendered = template.render(context)
+
+    assert rendered == "Async View: Testing"
+
+
+@pytest.mark.usefixtures("clear_cache")
+def test_async_view_cache(context):
+    template = Template(
+        "{% load dj_angles %}{% view 'tests.dj_angles.templatetags.view.test_view.async_counter_view' cache=60 %}"
+    )
+
+    assert template.render(context) == "Async Count: 1"
+    assert template.render(context) == "Async Count: 1"
+    assert context["request"].view_calls == 1
+
+
+def test_arender_to_string(rf):
+    request = rf.get("/")
+    request.events = {}
+
+    async def render():
+        request.events.update({"first": asyncio.Event(), "second": asyncio.Event()})
+        return await arender_to_string("async_views.html", request=request)
+
+    rendered = async_to_sync(render)()
+
+    (first, second) = rendered.strip().split(" ")
+
+    # Both views were awaited on the same thread instead of in a thread pool
+    assert first.startswith("first:")
+    assert second.startswith("second:")
+    assert first.split(":")[1] == second.split(":")[1]
+
+
+def test_prefetch_views_context_dependent_view(rf):
+    request = rf.get("/")
+
+    template = Template(
+        "{% load dj_angles %}{% view 'tests.dj_angles.templatetags.view.test_view.async_view' arg1=arg %}"
+    )
+
+    async def render():
+        context = Context({"request": request, "arg": "Testing"})
+        await prefetch_views(template, context)
+
+        return await asyncio.to_thread(template.render, context)
+
+    assert async_to_sync(render)() == "Async View: Testing"
+
+
+def test_prefetch_views_conditional_view(rf):
+    request = rf.get("/")
+
+    template = Template(
+        "{% load dj_angles %}"
+        "{% if show %}{% view 'tests.dj_angles.templatetags.view.test_view.async_counter_view' %}{% endif %}"
+    )
+
+    async def render():
+        context = Context({"request": request, "show": False})
+        await prefetch_views(template, context)
+
+        return await asyncio.to_thread(template.render, context)
+
+    assert async_to_sync(render)() == ""
+    assert not hasattr(request, "view_calls")
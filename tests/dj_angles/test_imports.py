@@ -0,0 +1,80 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+SRC_DIR = Path(__file__).parent.parent.parent / "src"
+
+
+def get_imported_modules(module: str, *, setup: bool = False) -> set[str]:
+    """Imports the module in a new interpreter and returns all of the modules that were imported.
+
+    Args:
+        param module: The module to import.
+        param setup: Whether to set up Django with `dj_angles` in `INSTALLED_APPS` before importing the module.
+    """
+
+    code = f"import sys; import {module}; print('\\n'.join(sys.modules))"
+
+    if setup:
+        code = (
+            "import django; from django.conf import settings; settings.configure(INSTALLED_APPS=['dj_angles']); "
+            f"django.setup(); {code}"
+        )
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", code],
+        capture_output=True,
+        check=True,
+        text=True,
+        env={**os.environ, "PYTHONPATH": str(SRC_DIR)},
+    )
+
+    return set(result.stdout.splitlines())
+
+
+def test_replacers_does_not_import_minestrone():
+    modules = get_imported_modules("dj_angles.replacers")
+
+    assert "dj_angles.replacers" in modules
+    assert "minestrone" not in modules
+
+
+def test_replacers_does_not_import_thirdparty_mappers():
+    modules = get_imported_modules("dj_angles.replacers")
+
+    assert "dj_angles.mappers" in modules
+    assert "dj_angles.mappers.thirdparty" not in modules
+
+
+def test_replacers_does_not_import_evaluator():
+    modules = get_imported_modules("dj_angles.replacers")
+
+    assert "dj_angles.evaluator" not in modules
+
+
+def test_setup_does_not_import_evaluator():
+    modules = get_imported_modules("dj_angles", setup=True)
+
+    assert "dj_angles.model_registry" in modules
+    assert "dj_angles.evaluator" not in modules
+    assert "dj_angles.templatetags.call" not in modules
+
+
+def test_mappers_missing_attribute():
+    import dj_angles.mappers  # noqa: PLC0415
+
+    with pytest.raises(AttributeError) as e:
+        dj_angles.mappers.map_missing  # noqa: B018
+
+    assert e.exconly() == "AttributeError: module 'dj_angles.mappers' has no attribute 'map_missing'"
+
+
+def test_mappers_thirdparty():
+    from dj_angles.mappers import map_bird, map_partial  # noqa: PLC0415
+    from dj_angles.mappers.thirdparty import map_bird as thirdparty_map_bird  # noqa: PLC0415
+    from dj_angles.mappers.thirdparty import map_partial as thirdparty_map_partial  # noqa: PLC0415
+
+    assert map_bird is thirdparty_map_bird
+    assert map_partial is thirdparty_map_partial
@@ -0,0 +1,22 @@
+from unittest.mock import patch
+
+from dj_angles.modules import is_module_available
+
+
+def test_is_module_available():
+    is_module_available.cache_clear()
+
+    assert is_module_available("django") is True
+    assert is_module_available("missing_module") is False
+
+
+def test_is_module_available_is_cached():
+    is_module_available.cache_clear()
+
+    with patch("dj_angles.modules.find_spec", return_value=None) as find_spec:
+        assert is_module_available("missing_module") is False
+        assert is_module_available("missing_module") is False
+
+    find_spec.assert_called_once_with("missing_module")
+
+    is_module_available.cache_clear()
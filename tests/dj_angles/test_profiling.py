@@ -0,0 +1,81 @@
+from django.template import Origin
+
+from dj_angles.profiling import ConversionProfiler
+from dj_angles.replacers import convert_template
+from dj_angles.signals import phase_converted
+
+TEMPLATE = """{# comment #}
+<div dj-if="show">{{ name or 'Unknown' }}</div>
+<span dj-value="title"></span>
+<dj-include 'partial' />
+"""
+
+
+def test_conversion_profiler():
+    origin = Origin(name="/templates/index.html", template_name="index.html")
+
+    with ConversionProfiler() as profiler:
+        convert_template(TEMPLATE, origin=origin)
+
+    assert [phase for (_, phase) in profiler.stats] == [
+        "mask_comments",
+        "replace_conditionals",
+        "replace_variables",
+        "replace_values",
+        "replace_tags",
+    ]
+
+    phases = profiler.get_phase_totals()
+
+    assert phases["mask_comments"].match_count == 1
+    assert phases["mask_comments"].edit_count == 1
+    assert phases["mask_comments"].input_size == len(TEMPLATE)
+    assert phases["replace_conditionals"].match_count == 1
+    assert phases["replace_conditionals"].edit_count == 3
+    assert phases["replace_variables"].match_count == 1
+    assert phases["replace_variables"].edit_count == 1
+    assert phases["replace_values"].match_count == 1
+    assert phases["replace_values"].edit_count == 1
+    assert phases["replace_tags"].match_count == 1
+    assert phases["replace_tags"].edit_count == 1
+
+    for stats in phases.values():
+        assert stats.count == 1
+        assert stats.duration > 0
+
+    templates = profiler.get_template_totals()
+
+    assert list(templates) == ["index.html"]
+    assert templates["index.html"].count == len(phases)
+
+
+def test_conversion_profiler_aggregates():
+    with ConversionProfiler() as profiler:
+        convert_template(TEMPLATE)
+        convert_template(TEMPLATE)
+
+    phases = profiler.get_phase_totals()
+
+    assert phases["replace_tags"].count == 2
+    assert phases["replace_tags"].match_count == 2
+    assert list(profiler.get_template_totals()) == [""]
+
+
+def test_conversion_profiler_disconnects():
+    with ConversionProfiler() as profiler:
+        pass
+
+    assert not phase_converted.has_listeners()
+
+    convert_template(TEMPLATE)
+
+    assert profiler.stats == {}
+
+
+def test_conversion_profiler_clear():
+    with ConversionProfiler() as profiler:
+        convert_template(TEMPLATE)
+
+    profiler.clear()
+
+    assert profiler.stats == {}
@@ -0,0 +1,54 @@
+import pytest
+from django.template import Context, Template
+from django.template.loader import get_template
+
+from dj_angles.timings import Timings, collect_timings, get_timings
+
+
+def test_get_timings():
+    assert get_timings() is None
+
+    with collect_timings() as timings:
+        assert get_timings() is timings
+
+    assert get_timings() is None
+
+
+def test_get_totals():
+    timings = Timings()
+    timings.add("call", "first", 0.001)
+    timings.add("call", "second", 0.002)
+    timings.add("view", "third", 0.003)
+
+    assert timings.get_totals() == {"call": (2, 0.003), "view": (1, 0.003)}
+
+
+def test_get_server_timing():
+    timings = Timings()
+    timings.add("call", "first", 0.00125)
+    timings.add("view", "second", 0.5)
+
+    assert timings.get_server_timing() == 'angles-call;dur=1.25;desc="call (1)", angles-view;dur=500.00;desc="view (1)"'
+
+
+@pytest.mark.django_db
+def test_template_tags():
+    template = Template("{% call get_name() %}{% model Book.objects.count() %}")
+
+    with collect_timings() as timings:
+        template.render(Context({"get_name": lambda: "test"}))
+
+    assert [(name, label) for name, label, _ in timings.events] == [
+        ("call", "get_name()"),
+        ("model", "Book.objects.count()"),
+    ]
+
+
+def test_convert(settings):
+    # Use the loader directly so the cached loader does not skip the conversion
+    settings.TEMPLATES[0]["OPTIONS"]["loaders"] = ["dj_angles.template_loader.Loader"]
+
+    with collect_timings() as timings:
+        get_template("slot.html")
+
+    assert [(name, label) for name, label, _ in timings.events] == [("convert", "slot.html")]